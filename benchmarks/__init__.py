@@ -0,0 +1 @@
+""" yamt benchmarks, run with `python -m benchmarks.<module>` from repository root """
@@ -0,0 +1,26 @@
+""" Runs every benchmark: `python -m benchmarks [name ...]` """
+import importlib
+import sys
+
+MODULES = (
+    "bench_import",
+    "bench_collections",
+    "bench_memory",
+    "bench_mapdefault",
+    "bench_asyncio",
+    "bench_enum",
+)
+
+
+def main():
+    names = sys.argv[1:] or MODULES
+    for name in names:
+        if not name.startswith("bench_"):
+            name = f"bench_{name}"
+        print(f"# {name}")
+        importlib.import_module(f"benchmarks.{name}").main()
+        print()
+
+
+if __name__ == "__main__":
+    main()
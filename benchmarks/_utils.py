@@ -0,0 +1,38 @@
+from collections.abc import Callable
+import tracemalloc
+import timeit
+import gc
+
+
+def bench(
+    name: str,
+    func: Callable[[], object],
+    number: int = 1,
+    repeat: int = 5,
+    ops: int | None = None
+) -> float:
+    """ Prints and returns best time of single `func` call """
+
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    line = f"{name:<56} {best * 1e3:>10.3f} ms"
+    if ops:
+        line += f" {best / ops * 1e9:>10.1f} ns/op"
+    print(line)
+    return best
+
+
+def memory(name: str, factory: Callable[[], object], number: int = 10_000) -> float:
+    """ Prints and returns average size in bytes of object created by `factory` """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for _ in range(number)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    size = (after - before) / number
+    del objects
+    print(f"{name:<56} {size:>10.1f} B/object")
+    return size
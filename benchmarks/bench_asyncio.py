@@ -0,0 +1,92 @@
+""" Async helpers: amapdefault, autogather, AsyncEventManager, queues and sync primitives """
+import asyncio
+
+from yamt import (
+    AsyncEventManager,
+    AsyncChainedQueue,
+    PerSecondSemaphore,
+    OverflowLock,
+    MetricsRegistry,
+    amapdefault,
+    autogather,
+)
+from benchmarks._utils import bench
+
+SIZE = 10_000
+
+
+async def identity(value: int) -> int:
+    return value
+
+
+def run(coro_factory):
+    return lambda: asyncio.run(coro_factory())
+
+
+def main():
+    data = list(range(SIZE))
+
+    async def amap():
+        return await amapdefault(identity, data, as_list=True)
+    bench("amapdefault coroutine func", run(amap), repeat=3, ops=SIZE)
+
+    async def gather_values():
+        return await autogather(data)
+    bench("autogather plain values", run(gather_values), repeat=3, ops=SIZE)
+
+    async def gather_coros():
+        return await autogather(map(identity, data))
+    bench("autogather coroutines", run(gather_coros), repeat=3, ops=SIZE)
+
+    async def gather_deadline():
+        return await autogather(map(identity, data), timeout=60)
+    bench("autogather coroutines with timeout", run(gather_deadline), repeat=3, ops=SIZE)
+
+    for title, profile in (("", False), (" + profiling", True)):
+        async def emit():
+            manager = AsyncEventManager(profile=profile)
+            for _ in range(10):
+                manager.on("event")(identity)
+            for i in range(SIZE // 10):
+                await manager.emit("event", i)
+        bench(f"AsyncEventManager.emit (10 handlers){title}", run(emit), repeat=3, ops=SIZE)
+
+    async def queue_producer_consumer():
+        queue = AsyncChainedQueue(4, maxlen=100, weights=(4, 3, 2, 1))
+
+        async def producer(lane: int):
+            for i in range(SIZE // 4):
+                await queue.put(i, lane)
+
+        async def consumer():
+            received = 0
+            while received < SIZE:
+                received += len(await queue.get_many(64))
+
+        await asyncio.gather(consumer(), *map(producer, range(4)))
+    bench(
+        "AsyncChainedQueue put/get_many (4 lanes)",
+        run(queue_producer_consumer),
+        repeat=3,
+        ops=SIZE
+    )
+
+    for title, metrics in (("", None), (" + metrics", MetricsRegistry())):
+        async def overflow_lock():
+            lock = OverflowLock(SIZE, metrics=metrics)
+            for _ in range(SIZE):
+                async with lock:
+                    pass
+        bench(f"OverflowLock acquire/release{title}", run(overflow_lock), repeat=3, ops=SIZE)
+
+        async def semaphore():
+            sem = PerSecondSemaphore(10 ** 9, metrics=metrics)
+            for _ in range(SIZE):
+                async with sem:
+                    pass
+            await asyncio.sleep(0)
+        bench(f"PerSecondSemaphore acquire/release{title}", run(semaphore), repeat=3, ops=SIZE)
+
+
+if __name__ == "__main__":
+    main()
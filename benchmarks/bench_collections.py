@@ -0,0 +1,38 @@
+""" ChainedSequence operations """
+from collections import deque
+
+from yamt import ChainedList, ChainedDeque
+from benchmarks._utils import bench, memory
+
+SEGMENTS = 10
+SEGMENT_SIZE = 10_000
+SIZE = SEGMENTS * SEGMENT_SIZE
+
+
+def main():
+    chain = ChainedList(*(list(range(SEGMENT_SIZE)) for _ in range(SEGMENTS)))
+    dchain = ChainedDeque(*(deque(range(SEGMENT_SIZE)) for _ in range(SEGMENTS)))
+
+    bench("ChainedList iter", lambda: sum(chain), ops=SIZE)
+    bench("ChainedList len", lambda: len(chain), number=10_000)
+    bench("ChainedList getitem (middle)", lambda: chain[SIZE // 2], number=1_000)
+    bench("ChainedList getitem (last)", lambda: chain[-1], number=1_000)
+    bench("ChainedList contains (missing)", lambda: -1 in chain, ops=SIZE)
+    bench("ChainedList index (last)", lambda: chain.index(SEGMENT_SIZE - 1, 0, SIZE), ops=SIZE)
+    bench("ChainedList slice [::2]", lambda: chain[::2], ops=SIZE)
+
+    def append_pop():
+        chain.append(1)
+        chain.pop()
+    bench("ChainedList append + pop", append_pop, number=1_000)
+
+    def deque_round():
+        dchain.append(1)
+        dchain.popleft()
+    bench("ChainedDeque append + popleft", deque_round, number=1_000)
+
+    memory("ChainedList of 2 empty lists", lambda: ChainedList([], []))
+
+
+if __name__ == "__main__":
+    main()
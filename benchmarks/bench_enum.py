@@ -0,0 +1,53 @@
+""" Import-time cost of generated DataRichEnum classes """
+from benchmarks._utils import bench
+
+SIZES = (100, 1_000, 10_000)
+
+TEMPLATE = """
+from enum import Enum
+from yamt import DataRichEnum
+
+
+class Extender:
+    __indexes__ = ("slug", )
+
+    def __init__(self, slug, code):
+        self.slug = slug
+        self.code = code
+
+
+class Generated({base}):
+    __containers__ = ("registry", )
+    registry = dict()
+
+{members}
+"""
+
+
+def make_source(size: int, base: str) -> str:
+    members = "\n".join(f"    M{i} = (\"m{i}\", {i})" for i in range(size))
+    return TEMPLATE.format(base=base, members=members)
+
+
+def main():
+    for size in SIZES:
+        for title, base in (
+            ("Enum", "Enum"),
+            ("DataRichEnum", "DataRichEnum"),
+            ("DataRichEnum + extender", "DataRichEnum, extender=Extender"),
+        ):
+            source = make_source(size, base)
+            if base == "Enum":
+                source = source.replace("    __containers__ = (\"registry\", )\n", "")
+                source = source.replace("    registry = dict()\n", "")
+            code = compile(source, f"<generated {size}>", "exec")
+            bench(
+                f"{title} with {size} members",
+                lambda: exec(code, dict()),
+                repeat=3,
+                ops=size
+            )
+
+
+if __name__ == "__main__":
+    main()
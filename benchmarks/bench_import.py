@@ -0,0 +1,33 @@
+""" Import time of yamt in fresh interpreters """
+import subprocess
+import sys
+
+from benchmarks._utils import bench
+
+STATEMENTS = (
+    "import yamt",
+    "from yamt import ChainedList",
+    "from yamt import Sentinel",
+    "from yamt import DataRichEnum",
+    "from yamt import autogather",
+    "import yamt; [getattr(yamt, i) for i in yamt.__all__]",
+)
+
+
+def main():
+    baseline = bench(
+        "python -c pass",
+        lambda: subprocess.run((sys.executable, "-c", "pass"), check=True),
+        repeat=5
+    )
+    for statement in STATEMENTS:
+        best = bench(
+            statement,
+            lambda: subprocess.run((sys.executable, "-c", statement), check=True),
+            repeat=5
+        )
+        print(f"{'':<56} {(best - baseline) * 1e3:>10.3f} ms over interpreter startup")
+
+
+if __name__ == "__main__":
+    main()
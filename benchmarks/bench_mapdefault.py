@@ -0,0 +1,38 @@
+""" Per-element overhead of mapdefault for every flag combination """
+import itertools
+
+from yamt import mapdefault
+from benchmarks._utils import bench
+
+SIZE = 1_000_000
+
+
+def main():
+    data = [i % 7 or None for i in range(SIZE)]
+    func = id
+
+    bench("map (baseline)", lambda: tuple(map(func, data)), repeat=3, ops=SIZE)
+    bench(
+        "mapdefault func=None",
+        lambda: mapdefault(None, data, as_tuple=True),
+        repeat=3,
+        ops=SIZE
+    )
+    for before, after, weak in itertools.product((False, True), repeat=3):
+        bench(
+            f"mapdefault before={before:d} after={after:d} weak={weak:d}",
+            lambda: mapdefault(
+                func,
+                data,
+                check_values_before=before,
+                check_values_after=after,
+                weak_value_check=weak,
+                as_tuple=True
+            ),
+            repeat=3,
+            ops=SIZE
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+""" Per-object memory of frequently created yamt objects """
+import asyncio
+from collections import deque
+
+from yamt import (
+    ChainedList,
+    ChainedDeque,
+    IterativeRandomizer,
+    AwaitableDescriptor,
+    Grab,
+    Sentinel,
+)
+from yamt.asyncio_misc import _autogather_executor
+from benchmarks._utils import memory
+
+
+async def coro_func(instance: object) -> None:
+    ...
+
+
+def main():
+    memory("Sentinel", Sentinel)
+    memory("ChainedList (2 shared lists)", lambda: ChainedList(*segments))
+    memory("ChainedDeque (2 shared deques)", lambda: ChainedDeque(*dsegments))
+    memory("IterativeRandomizer (shared data list)", lambda: IterativeRandomizer(()))
+    memory("AwaitableDescriptor", lambda: AwaitableDescriptor(coro_func))
+    memory("Grab.Skip", lambda: Grab.Skip(grab))
+
+    async def autogather_wrap():
+        loop = asyncio.get_running_loop()
+        memory("autogather completed future (running loop)", lambda: _autogather_executor(1, loop))
+    asyncio.run(autogather_wrap())
+    memory("autogather value wrapper (no loop)", lambda: _autogather_executor(1))
+
+
+segments = ([], [])
+dsegments = (deque(), deque())
+grab = Grab()
+
+if __name__ == "__main__":
+    main()
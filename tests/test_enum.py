@@ -0,0 +1,86 @@
+import pytest
+
+from yamt import DataRichEnum
+
+
+class Data(DataRichEnum):
+    FIRST = (1, [1, 2])
+    SECOND = (2, {"a": [3]})
+    THIRD = 3
+
+
+def test_unhashable_values_are_mapped():
+    assert set(Data._unhashable_value_map_.values()) == {Data.FIRST, Data.SECOND}
+
+
+def test_lookup_by_unhashable_value():
+    assert Data((1, [1, 2])) is Data.FIRST
+    assert Data((2, {"a": [3]})) is Data.SECOND
+    assert Data(3) is Data.THIRD
+
+
+class Planet(DataRichEnum):
+    __indexes__ = ("code", )
+    __multi_indexes__ = ("kind", "moons")
+
+    MERCURY = ("me", "rocky", [])
+    EARTH = ("ea", "rocky", ["moon"])
+    JUPITER = ("ju", "giant", ["io", "europa"])
+
+    def __init__(self, code: str, kind: str, moons: list[str]) -> None:
+        self.code = code
+        self.kind = kind
+        self.moons = moons
+
+
+def test_by_unique_index():
+    assert Planet.by("code", "ea") is Planet.EARTH
+    assert Planet.by("code", "xx", None) is None
+    with pytest.raises(ValueError):
+        Planet.by("code", "xx")
+
+
+def test_by_multi_index():
+    assert Planet.by("kind", "rocky") == (Planet.MERCURY, Planet.EARTH)
+    assert Planet.by("kind", "gas") == ()
+    assert Planet.by("moons", ["io", "europa"]) == (Planet.JUPITER, )
+
+
+def test_by_unhashable_query():
+    assert Planet.by("code", ["ea"], None) is None
+
+
+def test_unique_index_duplicates():
+    with pytest.raises(ValueError):
+        class Duplicated(DataRichEnum):
+            __indexes__ = ("code", )
+
+            A = ("a", 1)
+            B = ("a", 2)
+
+            def __init__(self, code: str, number: int) -> None:
+                self.code = code
+
+
+def test_unfreezable_values_use_linear_lookup():
+    class Unhashable:
+        __hash__ = None
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Unhashable)
+
+    class Raw(DataRichEnum):
+        BYTES = bytearray(b"x")
+        CUSTOM = (1, Unhashable())
+
+    assert Raw._unhashable_value_map_ == {}
+    assert Raw(bytearray(b"x")) is Raw.BYTES
+    assert Raw((1, Unhashable())) is Raw.CUSTOM
+
+
+def test_unfreezable_indexed_value():
+    with pytest.raises(TypeError, match="is indexed"):
+        class Indexed(DataRichEnum):
+            __indexes__ = ("value", )
+
+            BYTES = bytearray(b"x")
@@ -0,0 +1,64 @@
+from collections import deque
+import tracemalloc
+
+import pytest
+
+from yamt import (
+    ChainedList,
+    ChainedDeque,
+    IterativeRandomizer,
+    AwaitableDescriptor,
+    Grab,
+)
+from yamt.asyncio_misc import _AwaitableWrap
+
+SIZE_LIMIT = 128
+""" Loose bound of bytes per object (including per-object containers), slotted ones take 48-105 """
+
+segments = ([], [])
+dsegments = (deque(), deque())
+grab = Grab()
+
+
+async def coro_func(instance: object) -> None:
+    ...
+
+
+factories = pytest.mark.parametrize(
+    "factory",
+    (
+        lambda: ChainedList(*segments),
+        lambda: ChainedDeque(*dsegments),
+        lambda: IterativeRandomizer(()),
+        lambda: AwaitableDescriptor(coro_func),
+        lambda: Grab.Skip(grab),
+        lambda: _AwaitableWrap(1),
+    ),
+    ids=(
+        "ChainedList",
+        "ChainedDeque",
+        "IterativeRandomizer",
+        "AwaitableDescriptor",
+        "Grab.Skip",
+        "_AwaitableWrap",
+    ),
+)
+
+
+@factories
+def test_no_instance_dict(factory):
+    assert not hasattr(factory(), "__dict__")
+
+
+@factories
+def test_object_size(factory):
+    number = 1000
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for _ in range(number)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == number
+    assert (after - before) / number < SIZE_LIMIT
@@ -1,42 +1,212 @@
-from .collections import (
-    ChainedSequence,
-    ChainedList,
-    ChainedDeque,
-)
-from .enum import (
-    DataRichEnum,
-    IntDataRichEnum,
-)
-from .asyncio_sync_primitives import (
-    Grab,
-    StackLimitedLock,
-    SemaphorePerSecond,  # deprecated
-    PerSecondSemaphore,
-    OverflowLock,
-    SkippedOverflowLock,
-)
-from .misc import (
-    WordForm,
-    FormedWord,
-    Sentinel,
-    SingletonMeta,
-    IterativeRandomizer,
-    DependencyInjector as DI,
-    recursive_base_attributes,
-    split_on_chuncks,
-    simple_chain,
-    mapdefault,
-    sentinel,
-    anyvalue,
-)
-from .asyncio_misc import (
-    AsyncEventManager,
-    AwaitableDescriptor,
-    CachedAwaitableDescriptor,
-    autogather,
-    amapdefault,
-)
-from .typing import (
-    SupportsRichComparison,
-)
-from .decoration_trigger import DecorationTrigger
+""" Submodules are imported lazily on first access of exported name """
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from .collections import (
+        ChainedSequence,
+        ChainedList,
+        ChainedDeque,
+    )
+    from .mmap_collections import (
+        MappedRecordSequence,
+        MappedBlobSequence,
+        SpillingChainedList,
+    )
+    from .enum import (
+        DataRichEnum,
+        IntDataRichEnum,
+    )
+    from .asyncio_sync_primitives import (
+        Grab,
+        StackLimitedLock,
+        SemaphorePerSecond,  # deprecated
+        PerSecondSemaphore,
+        OverflowLock,
+        SkippedOverflowLock,
+    )
+    from .sync_primitives import (
+        ThreadGrab,
+        ThreadOverflowLock,
+        ThreadSkippedOverflowLock,
+        ThreadPerSecondSemaphore,
+        SharedOverflowLock,
+        SharedSkippedOverflowLock,
+        SharedPerSecondSemaphore,
+    )
+    from .misc import (
+        WordForm,
+        FormedWord,
+        SingletonMeta,
+        IterativeRandomizer,
+        DependencyInjector as DI,
+        DependencyScope,
+        Lifetime,
+        split_on_chuncks,
+        simple_chain,
+        mapdefault,
+        anyvalue,
+    )
+    from .sentinels import (
+        Sentinel,
+        sentinel,
+    )
+    from .attributes import recursive_base_attributes
+    from .asyncio_misc import (
+        AsyncEventManager,
+        AwaitableDescriptor,
+        CachedAwaitableDescriptor,
+        autogather,
+        amapdefault,
+    )
+    from .asyncio_collections import (
+        AsyncChainedQueue,
+    )
+    from .asyncio_iter import (
+        achain,
+        amerge,
+        abuffer,
+        abatch,
+        azip,
+        aanyvalue,
+    )
+    from .chunking import (
+        chunked,
+        achunked,
+        buffer_chunks,
+        weighted_chunks,
+        aweighted_chunks,
+        windowed,
+        awindowed,
+    )
+    from .metrics import (
+        Histogram,
+        MetricsRegistry,
+    )
+    from .typing import (
+        SupportsRichComparison,
+    )
+    from .decoration_trigger import DecorationTrigger, DecorationMode
+
+_exports: dict[str, tuple[str, ...]] = {
+    "collections": (
+        "ChainedSequence",
+        "ChainedList",
+        "ChainedDeque",
+    ),
+    "mmap_collections": (
+        "MappedRecordSequence",
+        "MappedBlobSequence",
+        "SpillingChainedList",
+    ),
+    "enum": (
+        "DataRichEnum",
+        "IntDataRichEnum",
+    ),
+    "asyncio_sync_primitives": (
+        "Grab",
+        "StackLimitedLock",
+        "SemaphorePerSecond",
+        "PerSecondSemaphore",
+        "OverflowLock",
+        "SkippedOverflowLock",
+    ),
+    "sync_primitives": (
+        "ThreadGrab",
+        "ThreadOverflowLock",
+        "ThreadSkippedOverflowLock",
+        "ThreadPerSecondSemaphore",
+        "SharedOverflowLock",
+        "SharedSkippedOverflowLock",
+        "SharedPerSecondSemaphore",
+    ),
+    "misc": (
+        "WordForm",
+        "FormedWord",
+        "SingletonMeta",
+        "IterativeRandomizer",
+        "DI",
+        "DependencyScope",
+        "Lifetime",
+        "split_on_chuncks",
+        "simple_chain",
+        "mapdefault",
+        "anyvalue",
+    ),
+    "sentinels": (
+        "Sentinel",
+        "sentinel",
+    ),
+    "attributes": (
+        "recursive_base_attributes",
+    ),
+    "asyncio_misc": (
+        "AsyncEventManager",
+        "AwaitableDescriptor",
+        "CachedAwaitableDescriptor",
+        "autogather",
+        "amapdefault",
+    ),
+    "asyncio_collections": (
+        "AsyncChainedQueue",
+    ),
+    "asyncio_iter": (
+        "achain",
+        "amerge",
+        "abuffer",
+        "abatch",
+        "azip",
+        "aanyvalue",
+    ),
+    "chunking": (
+        "chunked",
+        "achunked",
+        "buffer_chunks",
+        "weighted_chunks",
+        "aweighted_chunks",
+        "windowed",
+        "awindowed",
+    ),
+    "metrics": (
+        "Histogram",
+        "MetricsRegistry",
+    ),
+    "typing": (
+        "SupportsRichComparison",
+    ),
+    "decoration_trigger": (
+        "DecorationTrigger",
+        "DecorationMode",
+    ),
+}
+_aliases: dict[str, str] = {
+    "DI": "DependencyInjector",
+}
+_name_to_module: dict[str, str] = {
+    name: module
+    for module, names in _exports.items()
+    for name in names
+}
+
+_submodules: frozenset[str] = frozenset((*_exports, "exceptions"))
+
+__all__ = tuple(_name_to_module)
+
+
+def __getattr__(name: str):
+    module = _name_to_module.get(name)
+    if module is None:
+        if name in _submodules:
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(
+        importlib.import_module(f".{module}", __name__),
+        _aliases.get(name, name)
+    )
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
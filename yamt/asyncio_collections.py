@@ -0,0 +1,153 @@
+from typing import TypeVar, Generic
+from collections.abc import Iterable
+from collections import deque
+import asyncio
+
+from .collections import ChainedDeque
+
+T = TypeVar("T")
+
+
+class AsyncChainedQueue(Generic[T]):
+    """ Queue over `ChainedDeque`, where every contained deque is a lane.
+        Without `weights` lanes are priorities (lane 0 is served first),
+        with `weights` lanes are served by weighted round-robin
+        (up to `weights[i]` items in a row from lane `i`).
+        `maxlen` (single or per lane) makes `put` wait for free space.
+    """
+
+    __slots__ = ("lanes", "weights", "_getters", "_putters", "_current", "_credits")
+
+    lanes: ChainedDeque[T]
+    weights: tuple[int, ...] | None
+    _getters: deque[asyncio.Future]
+    _putters: tuple[deque[asyncio.Future], ...]
+    _current: int
+    _credits: int
+
+    def __init__(
+        self,
+        lanes: int = 1,
+        *,
+        maxlen: int | None | Iterable[int | None] = None,
+        weights: Iterable[int] | None = None
+    ) -> None:
+        assert lanes > 0
+        if maxlen is None or isinstance(maxlen, int):
+            maxlen = (maxlen, ) * lanes
+        else:
+            maxlen = tuple(maxlen)
+            assert len(maxlen) == lanes
+        self.lanes = ChainedDeque(*(deque(maxlen=i) for i in maxlen))
+
+        if weights is not None:
+            weights = tuple(weights)
+            assert len(weights) == lanes and all(i > 0 for i in weights)
+        self.weights = weights
+        self._getters = deque()
+        self._putters = tuple(deque() for _ in range(lanes))
+        self._current = 0
+        self._credits = 0 if weights is None else weights[0]
+
+    def __len__(self) -> int:
+        return len(self.lanes)
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(map(str, map(len, self.lanes.seqs)))
+        return f"<{self.__class__.__name__} lanes=[{sizes}]>"
+
+    def qsize(self, lane: int | None = None) -> int:
+        if lane is None:
+            return len(self.lanes)
+        return len(self.lanes.seqs[lane])
+
+    def empty(self) -> bool:
+        return not self.lanes
+
+    def full(self, lane: int = 0) -> bool:
+        seq = self.lanes.seqs[lane]
+        return seq.maxlen is not None and len(seq) >= seq.maxlen
+
+    def put_nowait(self, item: T, lane: int = 0):
+        if self.full(lane):
+            raise asyncio.QueueFull()
+        self.lanes.seqs[lane].append(item)
+        _wakeup_next(self._getters)
+
+    async def put(self, item: T, lane: int = 0):
+        putters = self._putters[lane]
+        while self.full(lane):
+            putter = asyncio.get_running_loop().create_future()
+            putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    putters.remove(putter)
+                except ValueError:
+                    ...
+                if not self.full(lane) and not putter.cancelled():
+                    _wakeup_next(putters)
+                raise
+        self.put_nowait(item, lane)
+
+    def get_nowait(self) -> T:
+        if self.empty():
+            raise asyncio.QueueEmpty()
+        lane = self._select_lane()
+        item = self.lanes.seqs[lane].popleft()
+        _wakeup_next(self._putters[lane])
+        return item
+
+    async def get(self) -> T:
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    ...
+                if not self.empty() and not getter.cancelled():
+                    _wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> list[T]:
+        """ Waits for at least one item, returns up to `n` without further waiting """
+
+        assert n > 0
+        items = [await self.get()]
+        while len(items) < n and not self.empty():
+            items.append(self.get_nowait())
+        if not self.empty():
+            _wakeup_next(self._getters)
+        return items
+
+    def _select_lane(self) -> int:
+        """ Must be called only on non-empty queue """
+
+        seqs = self.lanes.seqs
+        if self.weights is None:
+            for i, seq in enumerate(seqs):
+                if seq:
+                    return i
+
+        while True:
+            if self._credits > 0 and seqs[self._current]:
+                self._credits -= 1
+                return self._current
+            self._current = (self._current + 1) % len(seqs)
+            self._credits = self.weights[self._current]
+
+
+def _wakeup_next(waiters: deque[asyncio.Future]):
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
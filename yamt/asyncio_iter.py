@@ -0,0 +1,188 @@
+""" Async iterator combinators.
+    Background tasks are cancelled when consumer closes (or is cancelled),
+    exceptions of source iterators are propagated to consumer.
+"""
+from typing import TypeVar, Any, Literal
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+import asyncio
+
+from .chunking import _aiter
+from .sentinels import Sentinel
+
+T = TypeVar("T")
+
+_exhausted = Sentinel()
+
+
+async def achain(*iterables: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+    for iterable in iterables:
+        async for i in _aiter(iterable):
+            yield i
+
+
+async def amerge(
+    *iterables: AsyncIterable[T] | Iterable[T],
+    maxsize: int | None = None
+) -> AsyncIterator[T]:
+    """ Yields items of all iterables concurrently, as soon as they arrive.
+        Producers wait while `maxsize` (number of iterables by default) items are not consumed.
+    """
+
+    assert maxsize is None or maxsize > 0
+    queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(
+        maxsize or max(1, len(iterables))
+    )
+
+    async def producer(iterable: AsyncIterable[T] | Iterable[T]):
+        try:
+            async for i in _aiter(iterable):
+                await queue.put((i, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put((_exhausted, e))
+        else:
+            await queue.put((_exhausted, None))
+
+    tasks = [asyncio.ensure_future(producer(i)) for i in iterables]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item, exc = await queue.get()
+            if exc is not None:
+                raise exc
+            if item is _exhausted:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        await _cancel(tasks)
+
+
+async def abuffer(iterable: AsyncIterable[T] | Iterable[T], size: int = 1) -> AsyncIterator[T]:
+    """ Prefetches up to `size` items in background task,
+        so producer works while consumer processes previous items.
+    """
+
+    assert size > 0
+    queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(size)
+
+    async def producer():
+        try:
+            async for i in _aiter(iterable):
+                await queue.put((i, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put((_exhausted, e))
+        else:
+            await queue.put((_exhausted, None))
+
+    task = asyncio.ensure_future(producer())
+    try:
+        while True:
+            item, exc = await queue.get()
+            if exc is not None:
+                raise exc
+            if item is _exhausted:
+                break
+            yield item
+    finally:
+        await _cancel((task, ))
+
+
+async def abatch(
+    iterable: AsyncIterable[T] | Iterable[T],
+    size: int,
+    timeout: float | None = None
+) -> AsyncIterator[tuple[T, ...]]:
+    """ Batches of up to `size` items. With `timeout` incomplete batch is yielded
+        when `timeout` seconds passed since its first item.
+    """
+
+    assert size > 0
+    iterator = _aiter(iterable)
+    if timeout is None:
+        batch = list()
+        async for i in iterator:
+            batch.append(i)
+            if len(batch) == size:
+                yield tuple(batch)
+                batch.clear()
+        if batch:
+            yield tuple(batch)
+        return
+
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future | None = None
+    try:
+        while True:
+            batch = list()
+            deadline = None
+            while len(batch) < size:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator, _exhausted))
+                if deadline is None:
+                    item = await asyncio.shield(pending)
+                else:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    done, _ = await asyncio.wait((pending, ), timeout=remaining)
+                    if not done:
+                        break
+                    item = pending.result()
+                pending = None
+
+                if item is _exhausted:
+                    if batch:
+                        yield tuple(batch)
+                    return
+                if deadline is None:
+                    deadline = loop.time() + timeout
+                batch.append(item)
+            yield tuple(batch)
+    finally:
+        if pending is not None:
+            await _cancel((pending, ))
+
+
+async def azip(
+    *iterables: AsyncIterable[Any] | Iterable[Any],
+    strict: bool = False
+) -> AsyncIterator[tuple[Any, ...]]:
+    """ Like `zip`, next items of all iterables are awaited concurrently """
+
+    iterators = tuple(map(_aiter, iterables))
+    if not iterators:
+        return
+
+    while True:
+        tasks = [asyncio.ensure_future(anext(i, _exhausted)) for i in iterators]
+        try:
+            items = await asyncio.gather(*tasks)
+        finally:
+            await _cancel(tasks)
+        exhausted = sum(i is _exhausted for i in items)
+        if exhausted:
+            if strict and exhausted != len(items):
+                raise ValueError("azip() iterables have different lengths")
+            return
+        yield tuple(items)
+
+
+async def aanyvalue(iterable: AsyncIterable[T] | Iterable[T]) -> T | Literal[False]:
+    """ async version of anyvalue """
+
+    async for i in _aiter(iterable):
+        if i:
+            return i
+    return False
+
+
+async def _cancel(tasks: Iterable[asyncio.Future]):
+    tasks = [i for i in tasks if not i.done()]
+    for i in tasks:
+        i.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
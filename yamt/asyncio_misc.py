@@ -15,12 +15,16 @@ from collections.abc import (
     Hashable,
     Sequence,
 )
-from collections import defaultdict
+from collections import defaultdict, Counter
 import itertools
 import functools
+import inspect
 import asyncio
+import time
 
-from .misc import Sentinel
+from .misc import Sentinel, _none_filter
+from .metrics import Histogram
+from .asyncio_iter import _cancel
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -36,27 +40,173 @@ InstanceT = TypeVar("InstanceT")
 
 def autogather(
     *coros: Awaitable[T] | T | Iterable[Awaitable[T]] | Iterable[T],
-    return_exceptions: bool = False
+    return_exceptions: bool = False,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    return_partial: bool = True,
+    placeholder: Any = None,
+    hedge: float | Histogram | None = None,
+    hedge_quantile: float = 95
 ) -> Awaitable[tuple[T | BaseException, ...]]:
+    """ Coroutines are scheduled immediately (if loop is running), other values are returned as is.
+        With `timeout` (seconds) or `deadline` (`loop.time()` based) unfinished coroutines
+        are cancelled in time and replaced with `placeholder`,
+        or `asyncio.TimeoutError` is raised if not `return_partial`.
+        With `hedge` callables are treated as awaitable factories: if call is not finished
+        after `hedge` seconds (or `hedge_quantile` of `Histogram`, which collects latencies),
+        duplicate is started and first successful result is taken.
+    """
+
     actual_coros = list()
     for i in coros:
         if isinstance(i, Iterable):
             actual_coros.extend(i)
         else:
             actual_coros.append(i)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if timeout is not None or deadline is not None or hedge is not None:
+        gathering = _bounded_gather(
+            actual_coros,
+            return_exceptions,
+            timeout,
+            deadline,
+            return_partial,
+            placeholder,
+            hedge,
+            hedge_quantile
+        )
+        if loop is None:
+            return gathering
+        return loop.create_task(gathering)
+
     return asyncio.gather(
-        *map(_autogather_executor, actual_coros),
+        *(_autogather_executor(i, loop) for i in actual_coros),
         return_exceptions=return_exceptions
     )
 
 
-def _autogather_executor(coro: Awaitable[T] | T) -> T:
+def _autogather_executor(
+    coro: Awaitable[T] | T,
+    loop: asyncio.AbstractEventLoop | None = None
+) -> Awaitable[T]:
+    """ Completed future is used for plain values, so gather doesn't wrap them into tasks """
+
     if asyncio.iscoroutine(coro):
         return coro
-    return _AwaitableWrap(coro)
+    if loop is None:
+        return _AwaitableWrap(coro)
+    future = loop.create_future()
+    future.set_result(coro)
+    return future
+
+
+async def _bounded_gather(
+    coros: list[Awaitable[T] | T],
+    return_exceptions: bool,
+    timeout: float | None,
+    deadline: float | None,
+    return_partial: bool,
+    placeholder: Any,
+    hedge: float | Histogram | None,
+    hedge_quantile: float
+) -> list[T | BaseException]:
+    loop = asyncio.get_running_loop()
+    if timeout is not None:
+        timeout_at = loop.time() + timeout
+        deadline = timeout_at if deadline is None else min(deadline, timeout_at)
+
+    tasks = list()
+    for i in coros:
+        if hedge is not None and callable(i):
+            tasks.append(loop.create_task(_hedged(i, hedge, hedge_quantile)))
+        elif asyncio.iscoroutine(i):
+            tasks.append(loop.create_task(i))
+        else:
+            tasks.append(_autogather_executor(i, loop))
+
+    try:
+        pending = ()
+        if tasks:
+            _, pending = await asyncio.wait(
+                tasks,
+                timeout=None if deadline is None else max(0.0, deadline - loop.time()),
+                return_when=asyncio.ALL_COMPLETED if return_exceptions else asyncio.FIRST_EXCEPTION
+            )
+    finally:
+        await _cancel(tasks)
+
+    finished = [i for i in tasks if i not in pending]
+    if not return_exceptions:
+        for task in finished:
+            if task.cancelled():
+                raise asyncio.CancelledError()
+            if task.exception() is not None:
+                raise task.exception()
+    if pending and not return_partial:
+        raise asyncio.TimeoutError()
+
+    results = list()
+    for task in tasks:
+        if task in pending:
+            results.append(placeholder)
+        elif task.cancelled():
+            results.append(asyncio.CancelledError())
+        elif task.exception() is not None:
+            results.append(task.exception())
+        else:
+            results.append(task.result())
+    return results
+
+
+async def _hedged(
+    factory: Callable[[], Awaitable[T]],
+    hedge: float | Histogram,
+    hedge_quantile: float
+) -> T:
+    """ Runs `factory()`, and its duplicate if first call is slower than hedge delay """
+
+    if isinstance(hedge, Histogram):
+        delay = hedge.percentile(hedge_quantile) if hedge.count else None
+    else:
+        delay = hedge
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    attempts = [asyncio.ensure_future(factory())]
+    try:
+        if delay is not None:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                attempts.append(asyncio.ensure_future(factory()))
+
+        error = None
+        pending = set(attempts)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in attempts:
+                if attempt not in done or attempt.cancelled():
+                    continue
+                if attempt.exception() is None:
+                    if isinstance(hedge, Histogram):
+                        hedge.record(loop.time() - started)
+                    return attempt.result()
+                if error is None:
+                    error = attempt.exception()
+        if error is None:
+            raise asyncio.CancelledError()
+        raise error
+    finally:
+        await _cancel(attempts)
 
 
 class _AwaitableWrap(Generic[T]):
+    __slots__ = ("val", )
+
     val: T
 
     def __init__(self, val: T) -> None:
@@ -65,6 +215,9 @@ class _AwaitableWrap(Generic[T]):
     def __await__(self) -> "Self":
         return self
 
+    def __iter__(self) -> "Self":
+        return self
+
     def __next__(self) -> NoReturn:
         raise StopIteration(self.val)
 
@@ -73,7 +226,7 @@ _mapper_sentinel = Sentinel()
 
 
 async def amapdefault(
-    func: Callable[[T], Awaitable[ReturnT]] | None,
+    func: Callable[[T], Awaitable[ReturnT] | ReturnT] | None,
     *iterables: Iterable[T] | NoneT,
     default: DefaultT | None = None,
     default_factory: Callable[[], DefaultT | Awaitable[DefaultT]] | None = None,
@@ -87,75 +240,118 @@ async def amapdefault(
     """ async version of mapdefault with coro support """
 
     items = itertools.chain.from_iterable(
-        i
-        for i in iterables
-        if i != none and (not empty_check or i)
+        [i for i in iterables if i != none and (not empty_check or i)]
     )
+    if check_values_before:
+        items = _none_filter(items, none, weak_value_check)
     if func is not None:
-        items = (
-            _mapper_sentinel if (
-                check_values_before
-                and (
-                    (weak_value_check and not i)
-                    or i == none
-                )
-            ) else await func(i)
-            for i in items
-        )
-
-    result = _amapdefault_generator(
-        items,
-        none,
-        check_values_after,
-        weak_value_check
-    )
-    if not next(result):
+        items = _amap(func, items)
+    else:
+        items = _as_async_iterator(items)
+    if check_values_after:
+        items = _anone_filter(items, none, weak_value_check)
+
+    first = await anext(items, _mapper_sentinel)
+    if first is _mapper_sentinel:
         if default_factory is not None:
             default = default_factory()
-        if asyncio.iscoroutine(default_factory):
+        if inspect.isawaitable(default):
             default = await default
         return default
+
+    result = _aprepend(first, items)
     if as_list:
         result = [i async for i in result]
     return result
 
 
-async def _amapdefault_generator(
-    items: "Iterable[ReturnT | NoneT | Sentinel]",
-    none: NoneT = None,
-    check_values_after: bool = False,
-    weak_value_check: bool = False
-) -> Annotated[
-    AsyncIterator[ReturnT | bool],
-    bool, ReturnT, ReturnT, ...
-]:
-    first = True
+async def _amap(
+    func: Callable[[T], Awaitable[ReturnT] | ReturnT],
+    items: Iterable[T]
+) -> AsyncIterator[ReturnT]:
+    for i in items:
+        value = func(i)
+        if inspect.isawaitable(value):
+            value = await value
+        yield value
 
+
+async def _as_async_iterator(items: Iterable[T]) -> AsyncIterator[T]:
     for i in items:
-        if i is _mapper_sentinel:
+        yield i
+
+
+async def _anone_filter(
+    items: AsyncIterator[T],
+    none: Any,
+    weak_value_check: bool
+) -> AsyncIterator[T]:
+    async for i in items:
+        if weak_value_check and not i:
             continue
-        if check_values_after:
-            if not (weak_value_check and i):
-                continue
-            elif i == none:
-                continue
-
-        if first:
-            yield True
-            first = False
+        if i != none:
+            yield i
+
+
+async def _aprepend(first: T, items: AsyncIterator[T]) -> AsyncIterator[T]:
+    yield first
+    async for i in items:
         yield i
 
-    if first:
-        yield False
+
+class HandlerStats:
+    """ Calls accounting of single event handler, latency is in seconds """
+
+    __slots__ = ("count", "errors", "slow", "exceptions", "latency")
+
+    count: int
+    errors: int
+    slow: int
+    exceptions: defaultdict[str, int]
+    latency: Histogram
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.slow = 0
+        self.exceptions = defaultdict(int)
+        self.latency = Histogram()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "exceptions": dict(self.exceptions),
+            "latency": self.latency.snapshot(),
+        }
 
 
 class AsyncEventManager(Generic[KeyT]):
+    """ With profiling enabled every handler call is timed and its exceptions are counted,
+        `on_slow(name, handler, elapsed)` is called for calls longer than `slow_threshold`.
+        Profiling replaces `emit` of instance, so disabled one costs nothing.
+    """
+
     handlers: dict[KeyT, list[tuple[Callable, bool]]]
+    handler_stats: dict[tuple[KeyT, Callable], HandlerStats]
+    slow_threshold: float | None = None
+    on_slow: Callable[[KeyT, Callable, float], Any] | None = None
     _loop: asyncio.AbstractEventLoop | None
 
-    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+        *,
+        profile: bool = False,
+        slow_threshold: float | None = None,
+        on_slow: Callable[[KeyT, Callable, float], Any] | None = None
+    ) -> None:
         self._loop = loop
         self.handlers = defaultdict(list)
+        self.handler_stats = dict()
+        if profile:
+            self.enable_profiling(slow_threshold, on_slow)
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -183,8 +379,89 @@ class AsyncEventManager(Generic[KeyT]):
             return func
         return wrapper
 
+    @property
+    def profiling(self) -> bool:
+        return "emit" in self.__dict__
+
+    def enable_profiling(
+        self,
+        slow_threshold: float | None = None,
+        on_slow: Callable[[KeyT, Callable, float], Any] | None = None
+    ):
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+        self.emit = self._profiled_emit
+
+    def disable_profiling(self):
+        self.__dict__.pop("emit", None)
+
+    def stats(self) -> dict[KeyT, dict[str, dict[str, Any]]]:
+        """ Snapshot of handlers accounting, grouped by event name and handler name.
+            Handlers with same name (e.g. lambdas) get their `id` appended.
+        """
+
+        items = tuple(self.handler_stats.items())
+        names = Counter((name, _handler_name(func)) for (name, func), _ in items)
+        result: defaultdict[KeyT, dict[str, dict[str, Any]]] = defaultdict(dict)
+        for (name, func), stats in items:
+            handler = _handler_name(func)
+            if names[name, handler] > 1:
+                handler = f"{handler}#{id(func):x}"
+            result[name][handler] = stats.snapshot()
+        return dict(result)
+
+    def reset_stats(self):
+        self.handler_stats.clear()
+
+    async def _profiled_emit(self, name: KeyT, *args, **kwargs) -> Sequence:
+        return await asyncio.gather(
+            *(
+                self._profiled_call(name, func, with_name, args, kwargs)
+                for func, with_name in self.handlers[name]
+            )
+        )
+
+    async def _profiled_call(
+        self,
+        name: KeyT,
+        func: Callable,
+        with_name: bool,
+        args: tuple,
+        kwargs: dict[str, Any]
+    ) -> Any:
+        stats = self.handler_stats.get((name, func))
+        if stats is None:
+            stats = self.handler_stats[name, func] = HandlerStats()
+
+        started = time.perf_counter()
+        try:
+            if with_name:
+                return await func(name, *args, **kwargs)
+            return await func(*args, **kwargs)
+        except Exception as e:
+            stats.errors += 1
+            stats.exceptions[type(e).__qualname__] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.count += 1
+            stats.latency.record(elapsed)
+            if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+                stats.slow += 1
+                if self.on_slow is not None:
+                    self.on_slow(name, func, elapsed)
+
+
+def _handler_name(func: Callable) -> str:
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        return repr(func)
+    return f"{func.__module__}.{qualname}"
+
 
 class AwaitableDescriptor(Generic[T, InstanceT]):
+    __slots__ = ("func", "_instance")
+
     func: Callable[[InstanceT], Awaitable[T]]
     _instance: InstanceT
 
@@ -203,6 +480,8 @@ class AwaitableDescriptor(Generic[T, InstanceT]):
 
 
 class CachedAwaitableDescriptor(AwaitableDescriptor[T, InstanceT], Generic[T, InstanceT]):
+    __slots__ = ()
+
     @property
     def key(self) -> str:
         return f"_cache_{id(self)}"
@@ -4,18 +4,57 @@ import inspect
 import traceback
 import types
 import logging
+import time
+
+from .exceptions import ContextSkip, LockOverflowError
 
 if TYPE_CHECKING:
     from typing_extensions import Self
+    from .metrics import MetricsRegistry
 
 logger = logging.getLogger("yamt")
 
 
-class ContextSkip(Exception):
-    ...
+class Instrumented:
+    """ Optional metrics hook. Disabled (and free) unless registry
+        is passed to instance or assigned to class `metrics` attribute.
+    """
 
+    metrics: "MetricsRegistry | None" = None
+    metrics_name: str
+    _holds: "dict[asyncio.Task | None, list[float]] | None" = None
+    """ Acquire times per task, for primitives with multiple holders """
 
-class Grab:
+    def _init_metrics(
+        self,
+        metrics: "MetricsRegistry | None" = None,
+        metrics_name: str | None = None
+    ):
+        if metrics is not None:
+            self.metrics = metrics
+        self.metrics_name = metrics_name or f"{self.__class__.__name__}@{id(self):x}"
+
+    def _queue_depth(self) -> int:
+        waiters = getattr(self, "_waiters", None)
+        return len(waiters) if waiters else 0
+
+    def _hold_started(self):
+        if self._holds is None:
+            self._holds = dict()
+        self._holds.setdefault(asyncio.current_task(), list()).append(time.perf_counter())
+
+    def _hold_finished(self):
+        task = asyncio.current_task()
+        holds = self._holds.get(task) if self._holds else None
+        if not holds:
+            return
+        started_at = holds.pop()
+        if not holds:
+            del self._holds[task]
+        self.metrics.observe(self.metrics_name, "hold", time.perf_counter() - started_at)
+
+
+class Grab(Instrumented):
     """ Usage example:
         ```
         async with Grab() as grab, grab.skip:
@@ -24,6 +63,8 @@ class Grab:
     """
 
     class Skip:
+        __slots__ = ("grab", )
+
         grab: "Grab"
 
         def __init__(self, grab: "Grab") -> None:
@@ -31,6 +72,8 @@ class Grab:
 
         async def __aenter__(self):
             if self.grab.grab_count > 1:
+                if self.grab.metrics is not None:
+                    self.grab.metrics.increment(self.grab.metrics_name, "skipped")
                 raise ContextSkip()
 
         async def __aexit__(
@@ -44,11 +87,21 @@ class Grab:
     grab_count: int = 0
     skip: Skip
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        metrics: "MetricsRegistry | None" = None,
+        metrics_name: str | None = None
+    ) -> None:
         self.skip = self.Skip(self)
+        self._init_metrics(metrics, metrics_name)
 
     async def __aenter__(self) -> "Self":
         self.grab_count += 1
+        if self.metrics is not None:
+            self.metrics.increment(self.metrics_name, "acquired")
+            self.metrics.observe(self.metrics_name, "queue_depth", self.grab_count - 1)
+            self._hold_started()
         return self
 
     async def __aexit__(
@@ -57,22 +110,32 @@ class Grab:
         exc: BaseException | None,
         tb: types.TracebackType | None
     ) -> Literal[True] | None:
+        self.grab_count -= 1
+        if self.metrics is not None:
+            self._hold_finished()
         if isinstance(exc, ContextSkip):
             return True
-        self.grab_count -= 1
         return None
 
 
 # TODO: fix stack inspection in recursive call (rework locked_stack)
-class StackLimitedLock(asyncio.Lock):
+class StackLimitedLock(Instrumented, asyncio.Lock):
     stack_limit: int | None
     locked_stack: list[int]
+    _acquired_at: float = 0.0
 
-    def __init__(self, stack_limit: int | None = None) -> None:
+    def __init__(
+        self,
+        stack_limit: int | None = None,
+        *,
+        metrics: "MetricsRegistry | None" = None,
+        metrics_name: str | None = None
+    ) -> None:
         logger.warning("unstable synchronization primitive used")
         self.stack_limit = stack_limit
         self.locked_stack = list()
         super().__init__()
+        self._init_metrics(metrics, metrics_name)
 
     async def acquire(self):
         cur_frame = inspect.currentframe().f_back
@@ -84,28 +147,67 @@ class StackLimitedLock(asyncio.Lock):
                     break
                 if hash(frame.f_code) in self.locked_stack:
                     self.locked_stack.append(cur_hash)
+                    if self.metrics is not None:
+                        self.metrics.increment(self.metrics_name, "reentered")
                     return None
 
-        await super().acquire()
+        metrics = self.metrics
+        if metrics is None:
+            await super().acquire()
+        else:
+            metrics.observe(self.metrics_name, "queue_depth", self._queue_depth())
+            started_at = time.perf_counter()
+            await super().acquire()
+            self._acquired_at = time.perf_counter()
+            metrics.observe(self.metrics_name, "wait", self._acquired_at - started_at)
+            metrics.increment(self.metrics_name, "acquired")
         self.locked_stack.append(cur_hash)
 
     def release(self):
         cur_frame = inspect.currentframe().f_back
         self.locked_stack.remove(hash(cur_frame.f_code))
         if self.locked():
+            if self.metrics is not None and not self.locked_stack:
+                self.metrics.observe(
+                    self.metrics_name,
+                    "hold",
+                    time.perf_counter() - self._acquired_at
+                )
             super().release()
 
 
-class PerSecondSemaphore(asyncio.Semaphore):
+class PerSecondSemaphore(Instrumented, asyncio.Semaphore):
     deffer_time: float
     _lock: asyncio.Lock
 
-    def __init__(self, value: int = 1) -> None:
+    def __init__(
+        self,
+        value: int = 1,
+        *,
+        metrics: "MetricsRegistry | None" = None,
+        metrics_name: str | None = None
+    ) -> None:
         super().__init__(value)
         self.deffer_time = 1 / value
         self._lock = asyncio.Lock()
+        self._init_metrics(metrics, metrics_name)
+
+    async def acquire(self) -> Literal[True]:
+        metrics = self.metrics
+        if metrics is None:
+            return await super().acquire()
+
+        metrics.observe(self.metrics_name, "queue_depth", self._queue_depth())
+        started_at = time.perf_counter()
+        result = await super().acquire()
+        metrics.observe(self.metrics_name, "wait", time.perf_counter() - started_at)
+        metrics.increment(self.metrics_name, "acquired")
+        self._hold_started()
+        return result
 
     def release(self):
+        if self.metrics is not None:
+            self._hold_finished()
         asyncio.create_task(self._deffered_exit())
 
     async def _deffered_exit(self):
@@ -118,28 +220,49 @@ class PerSecondSemaphore(asyncio.Semaphore):
 SemaphorePerSecond = PerSecondSemaphore
 
 
-class LockOverflowError(Exception):
-    ...
-
-
-class OverflowLock(asyncio.Lock):
+class OverflowLock(Instrumented, asyncio.Lock):
     limit: int
     counter: int = 0
+    _acquired_at: float = 0.0
 
-    def __init__(self, limit: int) -> None:
+    def __init__(
+        self,
+        limit: int,
+        *,
+        metrics: "MetricsRegistry | None" = None,
+        metrics_name: str | None = None
+    ) -> None:
         self.limit = limit
         super().__init__()
+        self._init_metrics(metrics, metrics_name)
 
     async def acquire(self):
+        metrics = self.metrics
         if self.limit <= self.counter:
+            if metrics is not None:
+                metrics.increment(self.metrics_name, "rejected")
             raise LockOverflowError()
 
-        await super().acquire()
+        if metrics is None:
+            await super().acquire()
+        else:
+            metrics.observe(self.metrics_name, "queue_depth", self._queue_depth())
+            started_at = time.perf_counter()
+            await super().acquire()
+            self._acquired_at = time.perf_counter()
+            metrics.observe(self.metrics_name, "wait", self._acquired_at - started_at)
+            metrics.increment(self.metrics_name, "acquired")
         self.counter += 1
 
     def release(self):
         super().release()
         self.counter -= 1
+        if self.metrics is not None:
+            self.metrics.observe(
+                self.metrics_name,
+                "hold",
+                time.perf_counter() - self._acquired_at
+            )
 
 
 class SkippedOverflowLock(OverflowLock):
@@ -0,0 +1,60 @@
+from typing import Iterator, Any
+
+
+_BASE_ATTRIBUTES_CACHE = "_recursive_base_attributes_cache_"
+""" Stored in class itself: cached values (e.g. `__dict__` descriptor) reference the class,
+    so external weak-keyed cache would keep it alive
+"""
+
+
+def recursive_base_attributes(
+    cls: type,
+    *,
+    dedup: bool = False,
+    skip_dunders: bool = False,
+    skip_descriptors: bool = False,
+    cached: bool = True
+) -> Iterator[tuple[str, Any]]:
+    """ Yields attributes of class and its bases (except object) in MRO order.
+        `dedup` skips names shadowed by previous classes in MRO,
+        `skip_descriptors` skips data descriptors (properties, slots, etc).
+        Result is cached in class, pass `cached=False` to bypass cache (e.g. if class was mutated).
+    """
+
+    options = (dedup, skip_dunders, skip_descriptors)
+    per_class: dict[tuple[bool, ...], tuple] | None = cls.__dict__.get(_BASE_ATTRIBUTES_CACHE)
+    if cached and per_class is not None:
+        result = per_class.get(options)
+        if result is not None:
+            return iter(result)
+
+    result = list()
+    seen = set()
+    for base in cls.__mro__:
+        if base is object:
+            continue
+        for k, v in base.__dict__.items():
+            if k == _BASE_ATTRIBUTES_CACHE:
+                continue
+            if dedup:
+                if k in seen:
+                    continue
+                seen.add(k)
+            if skip_dunders and k[:2] == "__" and k[-2:] == "__":
+                continue
+            if skip_descriptors:
+                value_cls = type(v)
+                if hasattr(value_cls, "__set__") or hasattr(value_cls, "__delete__"):
+                    continue
+            result.append((k, v))
+
+    result = tuple(result)
+    if cached:
+        if per_class is None:
+            per_class = dict()
+            try:
+                setattr(cls, _BASE_ATTRIBUTES_CACHE, per_class)
+            except TypeError:
+                ...  # builtin or extension type
+        per_class[options] = result
+    return iter(result)
@@ -0,0 +1,173 @@
+""" Lazy chunking of iterables, async iterables and buffers """
+from typing import TypeVar, Any
+from collections.abc import (
+    Iterable,
+    Iterator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+)
+from collections import deque
+import itertools
+
+T = TypeVar("T")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[tuple[T, ...]]:
+    """ Lazy version of `split_on_chuncks`, works with any iterable """
+
+    assert size > 0
+    iterator = iter(iterable)
+    while chunk := tuple(itertools.islice(iterator, size)):
+        yield chunk
+
+
+async def achunked(
+    iterable: AsyncIterable[T] | Iterable[T],
+    size: int
+) -> AsyncIterator[tuple[T, ...]]:
+    assert size > 0
+    chunk = list()
+    async for i in _aiter(iterable):
+        chunk.append(i)
+        if len(chunk) == size:
+            yield tuple(chunk)
+            chunk.clear()
+    if chunk:
+        yield tuple(chunk)
+
+
+def buffer_chunks(buffer: Any, size: int) -> Iterator[memoryview]:
+    """ Zero-copy chunks of `bytes`, `bytearray`, `memoryview`, `array` etc.
+        Size is in items of buffer (bytes for bytes-like objects).
+    """
+
+    assert size > 0
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    if view.ndim != 1:
+        view = view.cast("B")
+    for i in range(0, len(view), size):
+        yield view[i:i + size]
+
+
+def weighted_chunks(
+    iterable: Iterable[T],
+    max_weight: float,
+    weight: Callable[[T], float] = len,
+    max_size: int | None = None
+) -> Iterator[tuple[T, ...]]:
+    """ Chunks with cumulative `weight` (e.g. byte size) not exceeding `max_weight`.
+        Single item heavier than `max_weight` is yielded as separate chunk.
+    """
+
+    chunk = list()
+    total = 0
+    for i in iterable:
+        item_weight = weight(i)
+        if chunk and (
+            total + item_weight > max_weight
+            or (max_size is not None and len(chunk) >= max_size)
+        ):
+            yield tuple(chunk)
+            chunk.clear()
+            total = 0
+        chunk.append(i)
+        total += item_weight
+    if chunk:
+        yield tuple(chunk)
+
+
+async def aweighted_chunks(
+    iterable: AsyncIterable[T] | Iterable[T],
+    max_weight: float,
+    weight: Callable[[T], float] = len,
+    max_size: int | None = None
+) -> AsyncIterator[tuple[T, ...]]:
+    chunk = list()
+    total = 0
+    async for i in _aiter(iterable):
+        item_weight = weight(i)
+        if chunk and (
+            total + item_weight > max_weight
+            or (max_size is not None and len(chunk) >= max_size)
+        ):
+            yield tuple(chunk)
+            chunk.clear()
+            total = 0
+        chunk.append(i)
+        total += item_weight
+    if chunk:
+        yield tuple(chunk)
+
+
+def windowed(
+    iterable: Iterable[T],
+    size: int,
+    step: int = 1,
+    partial: bool = False
+) -> Iterator[tuple[T, ...]]:
+    """ Sliding (`step` < `size`, overlapping) or hopping windows.
+        `partial` also yields incomplete trailing window.
+    """
+
+    assert size > 0 and step > 0
+    window: deque[T] = deque(maxlen=size)
+    to_skip = 0
+    pending = 0
+    for i in iterable:
+        if to_skip:
+            to_skip -= 1
+            continue
+        window.append(i)
+        pending += 1
+        if len(window) == size:
+            yield tuple(window)
+            pending = 0
+            if step >= size:
+                window.clear()
+                to_skip = step - size
+            else:
+                for _ in range(step):
+                    window.popleft()
+    if partial and window and pending:
+        yield tuple(window)
+
+
+async def awindowed(
+    iterable: AsyncIterable[T] | Iterable[T],
+    size: int,
+    step: int = 1,
+    partial: bool = False
+) -> AsyncIterator[tuple[T, ...]]:
+    assert size > 0 and step > 0
+    window: deque[T] = deque(maxlen=size)
+    to_skip = 0
+    pending = 0
+    async for i in _aiter(iterable):
+        if to_skip:
+            to_skip -= 1
+            continue
+        window.append(i)
+        pending += 1
+        if len(window) == size:
+            yield tuple(window)
+            pending = 0
+            if step >= size:
+                window.clear()
+                to_skip = step - size
+            else:
+                for _ in range(step):
+                    window.popleft()
+    if partial and window and pending:
+        yield tuple(window)
+
+
+def _aiter(iterable: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+    if isinstance(iterable, AsyncIterable):
+        return aiter(iterable)
+    return _sync_to_async(iterable)
+
+
+async def _sync_to_async(iterable: Iterable[T]) -> AsyncIterator[T]:
+    for i in iterable:
+        yield i
@@ -24,6 +24,8 @@ MSeqT = TypeVar("MSeqT", bound=MutableSequence)
 
 
 class ChainedSequence(MutableSequence, Generic[MSeqT, T]):
+    __slots__ = ("seqs", )
+
     seqs: tuple[MSeqT | MutableSequence[T]]
 
     @overload
@@ -258,6 +260,8 @@ class ChainedSequence(MutableSequence, Generic[MSeqT, T]):
 
 
 class ChainedList(ChainedSequence[list[T], T], Generic[T]):
+    __slots__ = ()
+
     def sort(
         self,
         *,
@@ -269,6 +273,8 @@ class ChainedList(ChainedSequence[list[T], T], Generic[T]):
 
 
 class ChainedDeque(ChainedSequence[deque[T], T], Generic[T]):
+    __slots__ = ()
+
     @property
     def maxlen(self) -> int | None:
         maxlens = tuple(i.maxlen for i in self.seqs)
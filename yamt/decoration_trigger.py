@@ -1,5 +1,7 @@
 from typing import Annotated, ParamSpec, TypeVar, Generic, Callable, Concatenate, Any
+from enum import Enum
 import functools
+import threading
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -10,8 +12,19 @@ UnboundFuncT = TypeVar("UnboundFuncT", bound=Callable[Concatenate[InstanceT, Sub
 BoundFuncT = TypeVar("BoundFuncT", bound=Callable[SubP, T])
 
 
+class DecorationMode(str, Enum):
+    INSTANCE = "instance"
+    """ decorates bound method of every instance in `__init__` """
+    CLASS = "class"
+    """ decorates unbound function once per class, on first instance creation """
+    LAZY = "lazy"
+    """ decorates bound method on first attribute access and caches it in instance """
+
+
 class DecorationTrigger(Generic[InstanceT, P]):
-    """ Decorator-postponing thing """
+    """ Decorator-postponing thing.
+        Decorators are applied in order: class, lazy, instance.
+    """
 
     decorators: list[
         tuple[
@@ -19,35 +32,108 @@ class DecorationTrigger(Generic[InstanceT, P]):
             Callable[[BoundFuncT], BoundFuncT | Any]
         ]
     ]
+    class_decorators: dict[str, list[Callable[[UnboundFuncT], UnboundFuncT | Any]]]
+    lazy_decorators: dict[str, list[Callable[[BoundFuncT], BoundFuncT | Any]]]
+    _marker: str
+    _lock: threading.RLock
 
     def __init__(self) -> None:
         self.decorators = list()
+        self.class_decorators = dict()
+        self.lazy_decorators = dict()
+        self._marker = f"_decoration_trigger_{id(self):x}"
+        self._lock = threading.RLock()
 
     def on(self, init: InitFuncT) -> InitFuncT:
         @functools.wraps(init)
         def wrapper(instance: InstanceT, *args: P.args, **kwargs: P.kwargs) -> None:
+            cls = type(instance)
+            if self._marker not in cls.__dict__:
+                self._compile(cls)
             for name, decorator in self.decorators:
-                func = getattr(instance, name)
-                decorated = decorator(func)
-                if isinstance(decorated, Callable):
-                    try:
-                        functools.update_wrapper(decorated, func)
-                    except Exception as e:
-                        ...
-                setattr(instance, name, decorated)
+                setattr(instance, name, _decorate(decorator, getattr(instance, name)))
             return init(instance, *args, **kwargs)
         return wrapper
 
     def apply(
         self,
         decorator: Callable[[BoundFuncT], BoundFuncT | Any],
-        name: str | None = None
+        name: str | None = None,
+        mode: DecorationMode | str = DecorationMode.INSTANCE
     ) -> Callable[[UnboundFuncT], UnboundFuncT]:
+        mode = DecorationMode(mode)
+
         def wrapper(func: UnboundFuncT) -> UnboundFuncT:
             nonlocal name
 
             if name is None:
                 name = func.__name__
-            self.decorators.append((name, decorator))
+            if mode is DecorationMode.CLASS:
+                self.class_decorators.setdefault(name, list()).append(decorator)
+            elif mode is DecorationMode.LAZY:
+                self.lazy_decorators.setdefault(name, list()).append(decorator)
+            else:
+                self.decorators.append((name, decorator))
             return func
         return wrapper
+
+    def _compile(self, cls: type):
+        """ Applies class-level and lazy decorators to owners of decorated functions """
+
+        with self._lock:
+            if self._marker not in cls.__dict__:
+                self._compile_locked(cls)
+
+    def _compile_locked(self, cls: type):
+        for name in self.class_decorators.keys() | self.lazy_decorators.keys():
+            owner = next((i for i in cls.__mro__ if name in i.__dict__), None)
+            if owner is None:
+                raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+            done: set[str] = owner.__dict__.get(self._marker + "_names")
+            if done is None:
+                done = set()
+                setattr(owner, self._marker + "_names", done)
+            elif name in done:
+                continue
+
+            func = owner.__dict__[name]
+            for decorator in self.class_decorators.get(name, ()):
+                func = _decorate(decorator, func)
+            lazy = self.lazy_decorators.get(name)
+            if lazy:
+                func = _LazyDecoration(name, func, lazy)
+            setattr(owner, name, func)
+            done.add(name)
+        setattr(cls, self._marker, True)
+
+
+class _LazyDecoration:
+    __slots__ = ("name", "func", "decorators")
+
+    name: str
+    func: Callable
+    decorators: list[Callable]
+
+    def __init__(self, name: str, func: Callable, decorators: list[Callable]) -> None:
+        self.name = name
+        self.func = func
+        self.decorators = decorators
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self.func
+        decorated = self.func.__get__(instance, owner)
+        for decorator in self.decorators:
+            decorated = _decorate(decorator, decorated)
+        instance.__dict__[self.name] = decorated
+        return decorated
+
+
+def _decorate(decorator: Callable[[T], Any], func: T) -> Any:
+    decorated = decorator(func)
+    if isinstance(decorated, Callable):
+        try:
+            functools.update_wrapper(decorated, func)
+        except Exception as e:
+            ...
+    return decorated
@@ -1,14 +1,48 @@
 from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable
 from enum import EnumMeta, Enum
 
-from .misc import recursive_base_attributes
+from .attributes import recursive_base_attributes
+from .sentinels import Sentinel
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
 
+_missing = Sentinel()
+
+
+def _freeze(value: Any) -> Any:
+    """ Hashable representation of (possibly) unhashable value, equal values gives equal keys """
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+
+    if isinstance(value, tuple):
+        return (tuple, tuple(map(_freeze, value)))
+    elif isinstance(value, list):
+        return (list, tuple(map(_freeze, value)))
+    elif isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, set):
+        return (set, frozenset(value))
+    raise TypeError(f"unhashable type: '{type(value).__name__}'")
+
+
 # TODO: try to fix typehints (maybe with typestubs?)
 class DataRichEnumMeta(EnumMeta):
+    """ Indexed lookups by member attributes can be declared with
+        `__indexes__` (unique values) and `__multi_indexes__` tuples of attribute names,
+        then `Enum.by("attr", value)` works in O(1).
+    """
+
+    _index_fields_: tuple[tuple[str, ...], tuple[str, ...]]
+    _indexes_: dict[str, tuple[bool, dict[Any, Any]]]
+    _unhashable_value_map_: dict[Any, Any]
+
     @classmethod
     def __prepare__(
         metacls,
@@ -34,19 +68,32 @@ class DataRichEnumMeta(EnumMeta):
             annotations: dict | None = classdict.get("__annotations__")
             if annotations is not None:
                 annotations.update(extender.__annotations__)
-            for k, v in recursive_base_attributes(extender):
+            for k, v in recursive_base_attributes(extender, dedup=True):
                 classdict.setdefault(k, v)
 
+        unique_indexes: Iterable[str] | None = classdict.pop("__indexes__", None)
+        multi_indexes: Iterable[str] | None = classdict.pop("__multi_indexes__", None)
+        if unique_indexes is None or multi_indexes is None:
+            inherited = next(
+                (i._index_fields_ for i in bases if hasattr(i, "_index_fields_")),
+                ((), ())
+            )
+            if unique_indexes is None:
+                unique_indexes = inherited[0]
+            if multi_indexes is None:
+                multi_indexes = inherited[1]
+
         containers_names = classdict.pop("__containers__", None)
         if containers_names is not None:
             assert isinstance(containers_names, tuple)
             for name in containers_names:
                 containers.append((name, classdict.pop(name)))
 
-            classdict._member_names = sorted(
-                set(classdict._member_names).difference(containers_names),
-                key=tuple(classdict._member_names).index
-            )
+            excluded = set(containers_names)
+            member_names = [i for i in classdict._member_names if i not in excluded]
+            if isinstance(classdict._member_names, dict):
+                member_names = dict.fromkeys(member_names)
+            classdict._member_names = member_names
             classdict._ignore.extend(containers_names)
             classdict["_ignore_"] = classdict._ignore
 
@@ -55,8 +102,94 @@ class DataRichEnumMeta(EnumMeta):
         if containers:
             for k, v in containers:
                 setattr(cls, k, v)
+
+        cls._index_fields_ = (tuple(unique_indexes), tuple(multi_indexes))
+        cls._indexes_ = metacls._build_indexes(cls, *cls._index_fields_)
+        cls._unhashable_value_map_ = dict()
+        for member in map(cls._member_map_.__getitem__, cls._member_names_):
+            try:
+                frozen = _freeze(member._value_)
+            except TypeError:
+                continue  # left to linear lookup of Enum
+            if frozen is not member._value_:
+                cls._unhashable_value_map_[frozen] = member
         return cls
 
+    def __call__(cls, value: Any, *args, **kwargs) -> Any:
+        if args or kwargs or not cls._member_map_:
+            return super().__call__(value, *args, **kwargs)
+
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            pass
+        except TypeError:
+            try:
+                return cls._unhashable_value_map_[_freeze(value)]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value)
+
+    def by(cls, field: str, value: Any, default: Any = _missing) -> Any:
+        """ Member with `field` attribute equal to `value`.
+            For multi indexes returns tuple of all matching members.
+        """
+
+        unique, index = cls._indexes_[field]
+        try:
+            key = _freeze(value)
+        except TypeError:
+            key = _missing
+        result = index.get(key, _missing)
+
+        if result is not _missing:
+            return result
+        elif not unique:
+            return ()
+        elif default is not _missing:
+            return default
+        raise ValueError(f"{value!r} is not a valid {cls.__qualname__}.{field}")
+
+    @staticmethod
+    def _build_indexes(
+        cls: type[Enum],
+        unique_fields: tuple[str, ...],
+        multi_fields: tuple[str, ...]
+    ) -> dict[str, tuple[bool, dict[Any, Any]]]:
+        indexes = dict()
+        members = tuple(map(cls._member_map_.__getitem__, cls._member_names_))
+
+        for field in unique_fields:
+            index = dict()
+            for member in members:
+                key = _index_key(cls, field, member)
+                existing = index.setdefault(key, member)
+                if existing is not member:
+                    raise ValueError(
+                        f"{cls.__qualname__}.{field} index is unique, "
+                        f"but {existing.name} and {member.name} shares value {key!r}"
+                    )
+            indexes[field] = (True, index)
+
+        for field in multi_fields:
+            index = dict()
+            for member in members:
+                key = _index_key(cls, field, member)
+                index.setdefault(key, list()).append(member)
+            indexes[field] = (False, {k: tuple(v) for k, v in index.items()})
+        return indexes
+
+
+def _index_key(cls: type[Enum], field: str, member: Enum) -> Any:
+    value = getattr(member, field)
+    try:
+        return _freeze(value)
+    except TypeError:
+        raise TypeError(
+            f"{cls.__qualname__}.{field} is indexed, "
+            f"but {member.name} has unhashable value {value!r}"
+        ) from None
+
 
 class DataRichEnum(Enum, metaclass=DataRichEnumMeta):
     ...
@@ -2,5 +2,24 @@ from typing import Any
 
 
 class InjectionError(Exception):
-    def __init__(self, key: Any) -> None:
-        super().__init__(f"'{key}' instance is inaccessible")
+    def __init__(self, key: Any, reason: str | None = None) -> None:
+        message = f"'{key}' instance is inaccessible"
+        if reason is not None:
+            message = f"{message}: {reason}"
+        super().__init__(message)
+
+
+class DependencyCycleError(InjectionError):
+    cycle: tuple[Any, ...]
+
+    def __init__(self, cycle: tuple[Any, ...]) -> None:
+        self.cycle = cycle
+        super().__init__(cycle[0], "dependency cycle " + " -> ".join(map(str, cycle)))
+
+
+class ContextSkip(Exception):
+    ...
+
+
+class LockOverflowError(Exception):
+    ...
@@ -0,0 +1,231 @@
+from typing import TYPE_CHECKING, Protocol, Any
+from collections.abc import Callable, Iterator
+from collections import defaultdict
+from array import array
+import threading
+import time
+import math
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class MetricsCallback(Protocol):
+    def __call__(self, source: str, metric: str, value: float) -> Any:
+        ...
+
+
+class Histogram:
+    """ HDR-style log-linear histogram with fixed memory footprint.
+        Values are recorded in integer `unit`s (microseconds by default for seconds input),
+        relative error is bounded by `significant_figures`.
+    """
+
+    __slots__ = (
+        "unit",
+        "highest",
+        "count",
+        "total",
+        "min",
+        "max",
+        "_sub_bits",
+        "_half",
+        "_counts",
+    )
+
+    unit: float
+    highest: int
+    count: int
+    total: float
+    min: float
+    max: float
+    _sub_bits: int
+    _half: int
+    _counts: array
+
+    def __init__(
+        self,
+        highest: float = 3600.0,
+        unit: float = 1e-6,
+        significant_figures: int = 2
+    ) -> None:
+        assert 1 <= significant_figures <= 5
+        self.unit = unit
+        self.highest = max(1, int(highest / unit))
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._half = 1 << (self._sub_bits - 1)
+        buckets = max(0, self.highest.bit_length() - self._sub_bits)
+        self._counts = array("Q", bytes(8 * (buckets + 2) * self._half))
+        self.reset()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[tuple[float, int]]:
+        """ Yields recorded value ranges (as lowest equivalent value) and its counts """
+        for i, count in enumerate(self._counts):
+            if count:
+                yield self._value_at(i) * self.unit, count
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} count={self.count} "
+            f"p50={self.percentile(50):.6g} p99={self.percentile(99):.6g} max={self.max:.6g}>"
+        )
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def record(self, value: float, count: int = 1):
+        raw = int(value / self.unit)
+        if raw < 0:
+            raw = 0
+        elif raw > self.highest:
+            raw = self.highest
+        self._counts[self._index_of(raw)] += count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for i, count in enumerate(self._counts):
+            if not count:
+                continue
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(i) * self.unit, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram"):
+        assert (
+            self.unit == other.unit
+            and self._sub_bits == other._sub_bits
+            and len(self._counts) == len(other._counts)
+        )
+        for i, count in enumerate(other._counts):
+            if count:
+                self._counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self):
+        for i in range(len(self._counts)):
+            self._counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def _index_of(self, raw: int) -> int:
+        bucket = raw.bit_length() - self._sub_bits
+        if bucket < 0:
+            bucket = 0
+        return (bucket * self._half) + (raw >> bucket)
+
+    def _value_at(self, index: int) -> int:
+        if index < 2 * self._half:
+            return index
+        bucket = index // self._half - 1
+        return (index - bucket * self._half) << bucket
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < 2 * self._half:
+            return index
+        bucket = index // self._half - 1
+        return ((index - bucket * self._half + 1) << bucket) - 1
+
+
+class MetricsRegistry:
+    """ Collects timings (into histograms) and counters reported by instrumented objects.
+        Every reported value is also forwarded to subscribed callbacks,
+        so registry can be plugged into any metrics exporter.
+    """
+
+    histograms: dict[tuple[str, str], Histogram]
+    counters: defaultdict[tuple[str, str], int]
+    callbacks: list[MetricsCallback]
+    histogram_factory: Callable[[], Histogram]
+    started_at: float
+    _lock: threading.Lock
+
+    def __init__(self, histogram_factory: Callable[[], Histogram] = Histogram) -> None:
+        self.histograms = dict()
+        self.counters = defaultdict(int)
+        self.callbacks = list()
+        self.histogram_factory = histogram_factory
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: MetricsCallback) -> MetricsCallback:
+        self.callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: MetricsCallback):
+        self.callbacks.remove(callback)
+
+    def observe(self, source: str, metric: str, value: float):
+        key = (source, metric)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, self.histogram_factory())
+        histogram.record(value)
+        for callback in self.callbacks:
+            callback(source, metric, value)
+
+    def increment(self, source: str, metric: str, value: int = 1):
+        self.counters[source, metric] += value
+        for callback in self.callbacks:
+            callback(source, metric, value)
+
+    def histogram(self, source: str, metric: str) -> Histogram | None:
+        return self.histograms.get((source, metric))
+
+    def counter(self, source: str, metric: str) -> int:
+        return self.counters.get((source, metric), 0)
+
+    def throughput(self, source: str, metric: str = "acquired") -> float:
+        """ Average rate of counter per second since creation or last reset """
+        elapsed = time.monotonic() - self.started_at
+        if elapsed <= 0:
+            return 0.0
+        return self.counter(source, metric) / elapsed
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        result: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+        for (source, metric), value in tuple(self.counters.items()):
+            result[source][metric] = value
+        for (source, metric), histogram in tuple(self.histograms.items()):
+            result[source][metric] = histogram.snapshot()
+        return dict(result)
+
+    def reset(self) -> "Self":
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started_at = time.monotonic()
+        return self
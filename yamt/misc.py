@@ -10,14 +10,31 @@ from typing import (
     ClassVar,
     Any,
     overload,
+    get_type_hints,
+    get_origin,
+    get_args,
 )
-from collections.abc import Iterable
-from collections import UserString
+from collections.abc import Iterable, Awaitable
+from collections import UserString, deque
+from concurrent.futures import Executor, Future
 from enum import Enum
+import collections.abc
+import contextvars
+import contextlib
 import itertools
+import threading
+import operator
+import functools
+import inspect
+import asyncio
+import weakref
 import random
+import os
 
-from .exceptions import InjectionError
+from .exceptions import InjectionError, DependencyCycleError
+from .chunking import chunked
+from .sentinels import Sentinel, sentinel
+from .attributes import recursive_base_attributes
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -32,15 +49,6 @@ ReturnT = TypeVar("ReturnT")
 SingletonT = TypeVar("SingletonT", bound="SingletonMeta")
 
 
-def recursive_base_attributes(cls: type) -> Iterator[tuple[str, Any]]:
-    if cls is object:
-        return
-
-    yield from cls.__dict__.items()
-    for i in cls.__bases__:
-        yield from recursive_base_attributes(i)
-
-
 def split_on_chuncks(size: int, *items: T) -> Generator[tuple[T, ...], None, None]:
     for i in range(0, len(items), size):
         yield items[i:i + size]
@@ -52,48 +60,165 @@ class WordForm(str, Enum):
     MIXED = "mix"
 
 
+def _plural_rule(
+    table: tuple[WordForm, ...],
+    exact: dict[int, WordForm] | None = None
+) -> Callable[[int], str]:
+    """ Compiles plural rule from forms for `n % 100` and overrides for exact `n` """
+
+    assert len(table) == 100
+    table = tuple(WordForm(i).value for i in table)
+    if exact is None:
+        return lambda n: table[abs(n) % 100]
+    exact = {k: WordForm(v).value for k, v in exact.items()}
+
+    def rule(n: int) -> str:
+        n = abs(n)
+        form = exact.get(n)
+        if form is None:
+            return table[n % 100]
+        return form
+    return rule
+
+
+_eastern_slavic_table = tuple(
+    WordForm.PLURAL if 11 <= i <= 14
+    else WordForm.SINGLE if i % 10 == 1
+    else WordForm.MIXED if 2 <= i % 10 <= 4
+    else WordForm.PLURAL
+    for i in range(100)
+)
+_polish_table = tuple(
+    WordForm.MIXED if 2 <= i % 10 <= 4 and not 12 <= i <= 14
+    else WordForm.PLURAL
+    for i in range(100)
+)
+_plural_only_table = (WordForm.PLURAL, ) * 100
+
+# language -> count -> form (SINGLE is "one", MIXED is "few", PLURAL is "many/other")
+PLURAL_RULES: dict[str, Callable[[int], WordForm | str]] = {
+    **dict.fromkeys(
+        ("en", "de", "nl", "sv", "da", "no", "fi", "es", "it", "pt", "el", "tr"),
+        _plural_rule(_plural_only_table, {1: WordForm.SINGLE})
+    ),
+    "fr": _plural_rule(_plural_only_table, {0: WordForm.SINGLE, 1: WordForm.SINGLE}),
+    **dict.fromkeys(("ru", "uk", "be"), _plural_rule(_eastern_slavic_table)),
+    "pl": _plural_rule(_polish_table, {1: WordForm.SINGLE}),
+    **dict.fromkeys(
+        ("cs", "sk"),
+        _plural_rule(
+            _plural_only_table,
+            {1: WordForm.SINGLE, 2: WordForm.MIXED, 3: WordForm.MIXED, 4: WordForm.MIXED}
+        )
+    ),
+    **dict.fromkeys(("ja", "zh", "ko", "vi", "th"), lambda n: WordForm.SINGLE.value),
+}
+
+
 class FormedWord(UserString):
+    """ String with word forms, renders as `default_form`.
+        Instances are immutable and interned: same forms gives same object.
+        Memory is saved only by interning, `UserString` base keeps instance `__dict__`.
+    """
+
+    data: str
     default_form: str
     si: str
     plu: str
     mix: str
-    _data: str | None = None
+    _forms: dict[str, str]
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         default_form: WordForm | str = WordForm.SINGLE,
         *,
         si: str | None = None,
         plu: str | None = None,
         mix: str | None = None,
         **kwargs: str
-    ) -> None:
-        locs = locals().copy()
-        del locs["self"], locs["default_form"], locs["kwargs"]
+    ) -> "Self":
+        if isinstance(default_form, WordForm):
+            default_form = default_form.value
+        if not (si or plu or mix or any(kwargs.values())):
+            forms = dict()
+            data = default_form
+        else:
+            forms = {
+                WordForm.SINGLE.value: si or "",
+                WordForm.PLURAL.value: plu or "",
+                WordForm.MIXED.value: mix or "",
+                **kwargs
+            }
+            data = forms.get(default_form)
+            if data is None:
+                raise NameError(f"word form '{default_form}' is not provided")
 
-        if not (set(locs) <= set(WordForm)):
-            raise NameError("word forms not matched with FormedWord init args")
-        elif not (any(locs.values()) or any(kwargs.values())):
-            self._data = default_form
-            return
+        key = (cls, default_form, *sorted(forms.items()))
+        self = _formed_words.get(key)
+        if self is not None:
+            return self
+
+        self = super().__new__(cls)
+
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "default_form", default_form)
+        object.__setattr__(self, "_forms", forms)
+        return _formed_words.setdefault(key, self)
 
-        self.__dict__.update((i.value, locs.get(i, "")) for i in WordForm)
-        self.__dict__.update(kwargs)
-        self.default_form = default_form
+    def __init__(self, *args, **kwargs) -> None:
+        ...
+
+    def __getattr__(self, name: str) -> str:
+        try:
+            return self._forms[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __copy__(self) -> "Self":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Self":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return _restore_formed_word, (self.__class__, self.default_form, self._forms)
 
     @property
-    def data(self) -> str:
-        return self._data or getattr(self, self.default_form)
+    def forms(self) -> dict[str, str]:
+        return self._forms.copy()
+
+    def with_form(self, form: WordForm | str) -> "Self":
+        if not self._forms:
+            return self
+        return self.__class__(form, **self._forms)
 
+    def for_count(self, count: int, lang: str = "en") -> str:
+        """ Word form for `count` by plural rules of `lang` (see `PLURAL_RULES`).
+            Falls back to plural and then single form if needed form is empty.
+        """
 
-class Sentinel:
-    __slots__ = ()
+        if not self._forms:
+            return self.data
+        forms = self._forms
+        return (
+            forms.get(PLURAL_RULES[lang](count))
+            or forms[WordForm.PLURAL.value]
+            or forms[WordForm.SINGLE.value]
+        )
 
-    def __repr__(self) -> str:
-        return f"<SENTINEL ({id(self)})>"
 
+_formed_words: "weakref.WeakValueDictionary[tuple, FormedWord]" = weakref.WeakValueDictionary()
 
-sentinel = Sentinel()
+
+def _restore_formed_word(
+    cls: type[FormedWord],
+    default_form: str,
+    forms: dict[str, str]
+) -> FormedWord:
+    return cls(default_form, **forms)
 
 
 @overload
@@ -127,89 +252,180 @@ def mapdefault(
     check_values_before: bool = False,
     check_values_after: bool = False,
     weak_value_check: bool = False,
-    as_tuple: bool = False
+    as_tuple: bool = False,
+    executor: Executor | None = None,
+    chunksize: int = 1,
+    prefetch: int | None = None
 ) -> tuple[ReturnT, ...] | Iterator[ReturnT] | DefaultT:
     """ Map iterables. Return default if all values is none.
         Can check not only iterables, but also values on none.
         Always calculates first element on call.
+        Pipeline is assembled from builtins for active options only.
+        With `executor` func is applied to `chunksize` items per task,
+        results are streamed in order with at most `prefetch` (2 per worker by default)
+        tasks submitted ahead.
     """
 
     items = itertools.chain.from_iterable(
-        i
-        for i in iterables
-        if i != none and (not empty_check or i)
+        [i for i in iterables if i != none and (not empty_check or i)]
     )
-    if func is not None:
-        items = (
-            _mapper_sentinel if (
-                check_values_before
-                and (
-                    (weak_value_check and not i)
-                    or i == none
-                )
-            ) else func(i)
-            for i in items
-        )
+    if check_values_before:
+        items = _none_filter(items, none, weak_value_check)
+    if func is None:
+        pass
+    elif executor is None:
+        items = map(func, items)
+    else:
+        items = _executor_map(executor, func, items, chunksize, prefetch)
+    if check_values_after:
+        items = _none_filter(items, none, weak_value_check)
 
-    result = _mapdefault_generator(
-        items,
-        none,
-        check_values_after,
-        weak_value_check
-    )
-    if not next(result):
+    first = next(items, _mapper_sentinel)
+    if first is _mapper_sentinel:
         if default_factory is not None:
             default = default_factory()
         return default
+
+    result = itertools.chain((first, ), items)
     if as_tuple:
         result = tuple(result)
     return result
 
 
-def _mapdefault_generator(
-    items: "Iterable[ReturnT | NoneT | Sentinel]",
-    none: NoneT = None,
-    check_values_after: bool = False,
-    weak_value_check: bool = False
-) -> Annotated[
-    Iterator[ReturnT | bool],
-    bool, ReturnT, ReturnT, ...
-]:
-    first = True
+def _executor_map(
+    executor: Executor,
+    func: Callable[[T], ReturnT],
+    items: Iterable[T],
+    chunksize: int,
+    prefetch: int | None
+) -> Iterator[ReturnT]:
+    if prefetch is None:
+        prefetch = 2 * (getattr(executor, "_max_workers", None) or os.cpu_count() or 1)
+    assert prefetch > 0
+
+    pending: deque[Future[list[ReturnT]]] = deque()
+    try:
+        for chunk in chunked(items, chunksize):
+            pending.append(executor.submit(_map_chunk, func, chunk))
+            if len(pending) >= prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for i in pending:
+            i.cancel()
 
-    for i in items:
-        if i is _mapper_sentinel:
-            continue
-        if check_values_after:
-            if not (weak_value_check and i):
-                continue
-            elif i == none:
-                continue
 
-        if first:
-            yield True
-            first = False
-        yield i
+def _map_chunk(func: Callable[[T], ReturnT], chunk: tuple[T, ...]) -> list[ReturnT]:
+    return list(map(func, chunk))
 
-    if first:
-        yield False
+
+def _none_filter(items: Iterator[T], none: Any, weak_value_check: bool) -> Iterator[T]:
+    """ Drops values equal to `none` (and falsy ones with `weak_value_check`) """
+
+    if weak_value_check:
+        if none is None:
+            return filter(None, items)
+        return (i for i in items if i and i != none)
+    elif none is None:
+        return filter(functools.partial(operator.is_not, None), items)
+    return (i for i in items if i != none)
 
 
 class SingletonMeta(type, Generic[SingletonT]):
-    __instance: SingletonT | None = None
+    """ Instance is stored per class (subclasses get their own),
+        creation is guarded by per class lock.
+        Instances are wiped in forked child processes unless `fork_reset=False` passed.
+        `await Cls.instance()` also awaits `__ainit__` of instance (once, single-flight).
+    """
+
+    _singleton_lock: threading.RLock
+    _singleton_pending: "asyncio.Task[SingletonT] | None"
+    _singleton_fork_reset: bool
+
+    def __new__(
+        metacls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        *,
+        fork_reset: bool = True,
+        **kwargs
+    ) -> "Self":
+        cls = super().__new__(metacls, name, bases, namespace, **kwargs)
+        cls._singleton_lock = threading.RLock()
+        cls._singleton_pending = None
+        cls._singleton_fork_reset = fork_reset
+        _singleton_classes.add(cls)
+        return cls
+
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        *,
+        fork_reset: bool = True,
+        **kwargs
+    ) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
 
     def __call__(cls: type[SingletonT], *args, **kwargs) -> SingletonT:
-        if cls.__instance is None:
-            cls.__instance = super().__call__(*args, **kwargs)
-        return cls.__instance
+        instance = cls.__dict__.get("_singleton_instance")
+        if instance is None:
+            with cls._singleton_lock:
+                instance = cls.__dict__.get("_singleton_instance")
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._singleton_instance = instance
+        return instance
+
+    async def instance(cls: type[SingletonT], *args, **kwargs) -> SingletonT:
+        if cls.__dict__.get("_singleton_ready", False):
+            return cls._singleton_instance
+
+        task = cls._singleton_pending
+        if task is None or (task.done() and (task.cancelled() or task.exception())):
+            task = cls._singleton_pending = asyncio.ensure_future(
+                cls._singleton_ainit(*args, **kwargs)
+            )
+        return await asyncio.shield(task)
+
+    async def _singleton_ainit(cls: type[SingletonT], *args, **kwargs) -> SingletonT:
+        instance = cls(*args, **kwargs)
+        ainit = getattr(instance, "__ainit__", None)
+        if ainit is not None:
+            await ainit()
+        cls._singleton_ready = True
+        return instance
 
-    @classmethod
     def _wipe_singleton(cls):
-        del cls.__instance
-        cls.__instance = None
+        with cls._singleton_lock:
+            for i in ("_singleton_instance", "_singleton_ready"):
+                if i in cls.__dict__:
+                    delattr(cls, i)
+            cls._singleton_pending = None
+
+
+_singleton_classes: "weakref.WeakSet[SingletonMeta]" = weakref.WeakSet()
+
+
+def _reset_singletons_after_fork():
+    for cls in tuple(_singleton_classes):
+        cls._singleton_lock = threading.RLock()
+        if cls._singleton_fork_reset:
+            cls._wipe_singleton()
+        else:
+            cls._singleton_pending = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_singletons_after_fork)
 
 
 class IterativeRandomizer(Generic[T]):
+    __slots__ = ("data", )
+
     data: list[T]
 
     def __init__(self, data: Iterable[T]) -> None:
@@ -238,16 +454,255 @@ def anyvalue(iterable: Iterable[T]) -> T | Literal[False]:
         return False
 
 
+class Lifetime(str, Enum):
+    SINGLETON = "singleton"
+    TRANSIENT = "transient"
+    SCOPED = "scoped"
+
+
+class _Provider:
+    __slots__ = (
+        "key",
+        "factory",
+        "lifetime",
+        "is_async",
+        "owner",
+        "pending",
+        "creating",
+        "dependencies",
+        "_context_factory",
+    )
+
+    key: str | type
+    factory: Callable[..., Any]
+    lifetime: Lifetime
+    is_async: bool
+    owner: type["DependencyInjector"]
+    pending: dict[tuple[asyncio.AbstractEventLoop, Any], "asyncio.Task"]
+    creating: threading.Lock
+    dependencies: tuple[tuple[str, Any, bool], ...]
+    _context_factory: Callable[..., Any] | None
+
+    def __init__(
+        self,
+        key: str | type,
+        factory: Callable[..., Any],
+        lifetime: Lifetime,
+        owner: type["DependencyInjector"]
+    ) -> None:
+        self.key = key
+        self.factory = factory
+        self.lifetime = lifetime
+        self.owner = owner
+        self.pending = dict()
+        self.creating = threading.Lock()
+        self.dependencies = _factory_dependencies(factory)
+        self.is_async = (
+            inspect.iscoroutinefunction(factory)
+            or inspect.isasyncgenfunction(factory)
+        )
+        if inspect.isgeneratorfunction(factory):
+            self._context_factory = contextlib.contextmanager(factory)
+        elif inspect.isasyncgenfunction(factory):
+            self._context_factory = contextlib.asynccontextmanager(factory)
+        else:
+            self._context_factory = None
+
+    def create(self, injector: type["DependencyInjector"], scope: "DependencyScope | None") -> Any:
+        kwargs = dict()
+        for name, key, optional in self.dependencies:
+            try:
+                kwargs[name] = injector.get(key)
+            except InjectionError:
+                if not optional:
+                    raise
+
+        if self._context_factory is None:
+            return self.factory(**kwargs)
+        cm = self._context_factory(**kwargs)
+        value = cm.__enter__()
+        self._add_teardown(injector, scope, cm)
+        return value
+
+    async def acreate(
+        self,
+        injector: type["DependencyInjector"],
+        scope: "DependencyScope | None"
+    ) -> Any:
+        values = await asyncio.gather(
+            *(injector.aget(key) for _, key, _ in self.dependencies),
+            return_exceptions=True
+        )
+        kwargs = dict()
+        for (name, key, optional), value in zip(self.dependencies, values):
+            if isinstance(value, BaseException):
+                if optional and isinstance(value, InjectionError):
+                    continue
+                raise value
+            kwargs[name] = value
+
+        if self._context_factory is None:
+            value = self.factory(**kwargs)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+        cm = self._context_factory(**kwargs)
+        if self.is_async:
+            value = await cm.__aenter__()
+        else:
+            value = cm.__enter__()
+        self._add_teardown(injector, scope, cm)
+        return value
+
+    def _add_teardown(
+        self,
+        injector: type["DependencyInjector"],
+        scope: "DependencyScope | None",
+        cm: Any
+    ):
+        if self.lifetime is Lifetime.SCOPED:
+            scope.teardowns.append(cm)
+            return
+        wave = _startup_wave.get()
+        if wave is not None:
+            wave.append((cm, self))
+        else:
+            injector._teardowns.append([(cm, self)])
+
+
+class DependencyScope:
+    """ Container for scoped dependencies (request, task, etc).
+        Active scope is tracked with contextvars,
+        so every task gets its own scope when entered inside of it.
+    """
+
+    name: str
+    values: dict[str | type, Any]
+    parent: "DependencyScope | None"
+    pending: dict[tuple[asyncio.AbstractEventLoop, Any], "asyncio.Task"]
+    teardowns: list[Any]
+    _token: contextvars.Token | None = None
+
+    def __init__(self, name: str = "request") -> None:
+        self.name = name
+        self.values = dict()
+        self.parent = None
+        self.pending = dict()
+        self.teardowns = list()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name!r}>"
+
+    def __enter__(self) -> "Self":
+        self.parent = _current_scope.get()
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            while self.teardowns:
+                cm = self.teardowns.pop()
+                if hasattr(cm, "__aexit__"):
+                    raise RuntimeError("scope with async teardowns must be exited with async with")
+                cm.__exit__(None, None, None)
+        finally:
+            _current_scope.reset(self._token)
+            self._token = None
+            self.values.clear()
+
+    async def __aenter__(self) -> "Self":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info):
+        for task in self.pending.values():
+            task.cancel()
+        while self.teardowns:
+            cm = self.teardowns.pop()
+            if hasattr(cm, "__aexit__"):
+                await cm.__aexit__(None, None, None)
+            else:
+                cm.__exit__(None, None, None)
+        self.__exit__(*exc_info)
+
+    def store(self, value: T, key: str | type[T] | None = None) -> T:
+        if key is None:
+            key = type(value)
+        self.values[key] = value
+        return value
+
+    def lookup(self, key: str | type) -> Any:
+        scope = self
+        while scope is not None:
+            value = scope.values.get(key, _injector_sentinel)
+            if value is not _injector_sentinel:
+                return value
+            scope = scope.parent
+        return _injector_sentinel
+
+    @staticmethod
+    def current() -> "DependencyScope | None":
+        return _current_scope.get()
+
+
+_current_scope: contextvars.ContextVar[DependencyScope | None] = contextvars.ContextVar(
+    "yamt_dependency_scope",
+    default=None
+)
+_resolving: contextvars.ContextVar[tuple[Any, ...]] = contextvars.ContextVar(
+    "yamt_dependency_resolving",
+    default=()
+)
+_startup_wave: contextvars.ContextVar[list[tuple[Any, _Provider]] | None] = contextvars.ContextVar(
+    "yamt_dependency_startup_wave",
+    default=None
+)
+_injector_sentinel = Sentinel()
+
+
 class DependencyInjector(Generic[T, InstanceT]):
+    """ Descriptor-based dependency injector.
+        Every subclass has its own container and falls back to containers of its bases.
+        Descriptors cache resolved app-level values until any container changes.
+        Factories receive dependencies by type hints of their parameters
+        (`Annotated[T, "key"]` for string keys), generator factories
+        are torn down on `shutdown` of injector they were resolved with
+        (or scope exit for scoped lifetime).
+        Factories run outside of locks, concurrent calls for same key share single call
+        (per event loop for `aget`, first stored value wins between loops).
+    """
+
     container: ClassVar[dict[str | type, Any]] = dict()
+    providers: ClassVar[dict[str | type, _Provider]] = dict()
+    _lookup: ClassVar[tuple[type["DependencyInjector"], ...]]
+    _teardowns: ClassVar[list[list[tuple[Any, _Provider]]]] = list()
+    _version: ClassVar[int] = 0
+    _lock: ClassVar[threading.RLock] = threading.RLock()
     key: str | type[T]
+    _cache: tuple[int, T] | None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.container = dict()
+        cls.providers = dict()
+        cls._teardowns = list()
+        cls._lock = threading.RLock()
+        cls._lookup = tuple(i for i in cls.__mro__ if issubclass(i, DependencyInjector))
 
     def __init__(self, key: str | type[T]) -> None:
         self.key = key
+        self._cache = None
 
     @property
     def value(self) -> T:
-        return self.get(self.key)
+        cache = self._cache
+        version = DependencyInjector._version
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        value, cacheable = self._resolve(self.key)
+        if cacheable:
+            self._cache = (version, value)
+        return value
 
     @overload
     def __get__(self, instance: InstanceT, cls: type[InstanceT] | None = None) -> T:
@@ -270,12 +725,327 @@ class DependencyInjector(Generic[T, InstanceT]):
     def store(cls, value: Annotated[TT, "SameAs[T]"], key: str | type[TT] | None = None) -> TT:
         if key is None:
             key = type(value)
-        cls.container[key] = value
+        with cls._lock:
+            cls.container[key] = value
+            cls._invalidate()
         return value
 
+    @classmethod
+    def register(
+        cls,
+        factory: Callable[..., TT | Awaitable[TT]],
+        key: str | type[TT] | None = None,
+        lifetime: Lifetime | str = Lifetime.SINGLETON
+    ) -> Callable[..., TT | Awaitable[TT]]:
+        """ Registers lazy factory. Async factories are resolved with `aget`,
+            concurrent calls share single factory call.
+        """
+
+        if key is None:
+            key = _factory_key(factory)
+        with cls._lock:
+            cls.providers[key] = _Provider(key, factory, Lifetime(lifetime), cls)
+            cls._invalidate()
+        return factory
+
+    @classmethod
+    def discard(cls, key: str | type):
+        with cls._lock:
+            cls.container.pop(key, None)
+            cls.providers.pop(key, None)
+            cls._invalidate()
+
     @classmethod
     def get(cls, key: str | type[Annotated[TT, "SameAs[T]"]]) -> TT:
-        value = cls.container.get(key)
-        if value is None:
-            raise InjectionError(key)
-        return value
+        return cls._resolve(key)[0]
+
+    @classmethod
+    async def aget(cls, key: str | type[Annotated[TT, "SameAs[T]"]]) -> TT:
+        value, provider, scope = cls._lookup_value(key)
+        if value is not _injector_sentinel:
+            return value
+        if not provider.is_async and not provider.dependencies:
+            return cls._provide(key, provider, scope)[0]
+
+        resolving = _resolving.get()
+        if key in resolving:
+            raise DependencyCycleError((*resolving[resolving.index(key):], key))
+        token = _resolving.set((*resolving, key))
+        try:
+            if provider.lifetime is Lifetime.TRANSIENT:
+                return await provider.acreate(cls, scope)
+
+            if provider.lifetime is Lifetime.SCOPED:
+                if scope is None:
+                    raise InjectionError(key, "no active scope")
+                target, pending = scope.values, scope.pending
+            else:
+                target, pending = provider.owner.container, provider.pending
+            pending_key = (asyncio.get_running_loop(), key)
+            task = pending.get(pending_key)
+            if task is None:
+                task = asyncio.ensure_future(provider.acreate(cls, scope))
+                pending[pending_key] = task
+                task.add_done_callback(functools.partial(
+                    _store_provided,
+                    provider.owner,
+                    key,
+                    target,
+                    pending,
+                    provider.lifetime is Lifetime.SINGLETON
+                ))
+        finally:
+            _resolving.reset(token)
+        return await asyncio.shield(task)
+
+    @classmethod
+    def scope(cls, name: str = "request") -> DependencyScope:
+        return DependencyScope(name)
+
+    @classmethod
+    def dependency_graph(cls) -> dict[str | type, set[str | type]]:
+        """ Not yet created singletons and its dependencies on each other """
+
+        providers: dict[str | type, _Provider] = dict()
+        for i in reversed(cls._lookup):
+            providers.update(i.providers)
+
+        graph = dict()
+        for key, provider in providers.items():
+            if provider.lifetime is not Lifetime.SINGLETON or cls._has_value(key):
+                continue
+            deps = graph[key] = set()
+            for _, dep, optional in provider.dependencies:
+                if dep in providers:
+                    if (
+                        providers[dep].lifetime is Lifetime.SINGLETON
+                        and not cls._has_value(dep)
+                    ):
+                        deps.add(dep)
+                elif not (optional or cls._has_value(dep)):
+                    raise InjectionError(dep, f"required by '{key}'")
+        return graph
+
+    @classmethod
+    async def startup(cls) -> list[list[str | type]]:
+        """ Creates all registered singletons, independent ones concurrently.
+            Returns created keys grouped by initialization waves.
+        """
+
+        waves = _topological_waves(cls.dependency_graph())
+        for wave in waves:
+            teardowns = list()
+            token = _startup_wave.set(teardowns)
+            try:
+                await asyncio.gather(*map(cls.aget, wave))
+            finally:
+                _startup_wave.reset(token)
+                if teardowns:
+                    cls._teardowns.append(teardowns)
+        return waves
+
+    @classmethod
+    async def shutdown(cls):
+        """ Tears down created generator-based singletons in reversed creation order
+            and removes them (and own created singletons) from containers
+        """
+
+        while cls._teardowns:
+            wave = cls._teardowns.pop()
+            for _, provider in wave:
+                with provider.owner._lock:
+                    provider.owner.container.pop(provider.key, None)
+            cls._invalidate()
+            for cm, _ in wave:
+                if not hasattr(cm, "__aexit__"):
+                    cm.__exit__(None, None, None)
+            await asyncio.gather(*(
+                cm.__aexit__(None, None, None)
+                for cm, _ in wave
+                if hasattr(cm, "__aexit__")
+            ))
+        with cls._lock:
+            for key, provider in cls.providers.items():
+                if provider.lifetime is Lifetime.SINGLETON:
+                    cls.container.pop(key, None)
+            cls._invalidate()
+
+    @classmethod
+    def _has_value(cls, key: str | type) -> bool:
+        return any(key in i.container for i in cls._lookup)
+
+    @classmethod
+    def _resolve(cls, key: str | type) -> tuple[Any, bool]:
+        """ Returns value and whether it can be cached by descriptors """
+
+        value, provider, scope = cls._lookup_value(key)
+        if value is not _injector_sentinel:
+            return value, scope is None
+        return cls._provide(key, provider, scope)
+
+    @classmethod
+    def _lookup_value(cls, key: str | type) -> tuple[Any, _Provider | None, DependencyScope | None]:
+        for i in cls._lookup:
+            value = i.container.get(key, _injector_sentinel)
+            if value is not _injector_sentinel:
+                return value, None, None
+
+        scope = _current_scope.get()
+        if scope is not None:
+            value = scope.lookup(key)
+            if value is not _injector_sentinel:
+                return value, None, scope
+
+        for i in cls._lookup:
+            provider = i.providers.get(key)
+            if provider is not None:
+                return _injector_sentinel, provider, scope
+        raise InjectionError(key)
+
+    @classmethod
+    def _provide(
+        cls,
+        key: str | type,
+        provider: _Provider,
+        scope: DependencyScope | None
+    ) -> tuple[Any, bool]:
+        if provider.is_async:
+            raise InjectionError(key, "async factory, use aget")
+
+        resolving = _resolving.get()
+        if key in resolving:
+            raise DependencyCycleError((*resolving[resolving.index(key):], key))
+        token = _resolving.set((*resolving, key))
+        try:
+            if provider.lifetime is Lifetime.TRANSIENT:
+                return provider.create(cls, scope), False
+
+            if provider.lifetime is Lifetime.SCOPED:
+                if scope is None:
+                    raise InjectionError(key, "no active scope")
+                value = scope.values[key] = provider.create(cls, scope)
+                return value, False
+
+            container = provider.owner.container
+            value = container.get(key, _injector_sentinel)
+            if value is _injector_sentinel:
+                with provider.creating:
+                    value = container.get(key, _injector_sentinel)
+                    if value is _injector_sentinel:
+                        value = provider.create(cls, scope)
+                        with provider.owner._lock:
+                            value = container.setdefault(key, value)
+                        cls._invalidate()
+            return value, True
+        finally:
+            _resolving.reset(token)
+
+    @staticmethod
+    def _invalidate():
+        DependencyInjector._version += 1
+
+
+DependencyInjector._lookup = (DependencyInjector, )
+
+
+def _store_provided(
+    injector: type[DependencyInjector],
+    key: str | type,
+    target: dict[str | type, Any],
+    pending: dict[tuple[asyncio.AbstractEventLoop, Any], "asyncio.Task"],
+    in_container: bool,
+    task: "asyncio.Task"
+):
+    """ Scoped values are not cached by descriptors, so only containers changes invalidate """
+
+    pending.pop((task.get_loop(), key), None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    with injector._lock:
+        target.setdefault(key, task.result())
+        if in_container:
+            injector._invalidate()
+
+
+_iterator_origins = (
+    collections.abc.Iterator,
+    collections.abc.Iterable,
+    collections.abc.Generator,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncGenerator,
+)
+
+
+def _factory_key(factory: Callable) -> type:
+    if isinstance(factory, type):
+        return factory
+    try:
+        key = get_type_hints(factory).get("return")
+    except Exception:
+        key = getattr(factory, "__annotations__", {}).get("return")
+    if key is None:
+        raise InjectionError(factory, "unable to infer key from factory return annotation")
+    if (
+        (inspect.isgeneratorfunction(factory) or inspect.isasyncgenfunction(factory))
+        and get_origin(key) in _iterator_origins
+    ):
+        key = get_args(key)[0]
+    return key
+
+
+def _factory_dependencies(factory: Callable) -> tuple[tuple[str, Any, bool], ...]:
+    """ Returns (parameter name, key, is optional) for every annotated parameter """
+
+    try:
+        signature = inspect.signature(factory)
+        hints = get_type_hints(
+            factory.__init__ if isinstance(factory, type) else factory,
+            include_extras=True
+        )
+    except (TypeError, ValueError, NameError):
+        return ()
+
+    dependencies = list()
+    for name, param in signature.parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        key = hints.get(name)
+        if key is None:
+            continue
+        if get_origin(key) is Annotated:
+            key, *metadata = get_args(key)
+            for i in metadata:
+                if isinstance(i, str):
+                    key = i
+                    break
+        dependencies.append((name, key, param.default is not param.empty))
+    return tuple(dependencies)
+
+
+def _topological_waves(graph: dict[T, set[T]]) -> list[list[T]]:
+    """ Groups graph nodes into waves, every node depends only on nodes of previous waves """
+
+    remaining = {k: set(v) for k, v in graph.items()}
+    waves = list()
+    while remaining:
+        wave = [k for k, deps in remaining.items() if not deps]
+        if not wave:
+            raise DependencyCycleError(_find_cycle(remaining))
+        for key in wave:
+            del remaining[key]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+        waves.append(wave)
+    return waves
+
+
+def _find_cycle(graph: dict[T, set[T]]) -> tuple[T, ...]:
+    path: list[T] = list()
+    visited: set[T] = set()
+    node = next(iter(graph))
+    while node not in visited:
+        visited.add(node)
+        path.append(node)
+        node = next(iter(graph[node]))
+    return (*path[path.index(node):], node)
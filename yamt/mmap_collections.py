@@ -0,0 +1,416 @@
+""" Append-only file-backed sequences for out-of-core `ChainedSequence` segments """
+from typing import TYPE_CHECKING, TypeVar, Generic, SupportsIndex, Any, overload
+from collections.abc import Iterable, Iterator, Callable, MutableSequence
+from array import array
+import itertools
+import tempfile
+import struct
+import mmap
+import os
+
+from .collections import ChainedSequence
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+_HEADER = struct.Struct("<8sQ")
+_MAGIC = b"yamtseg1"
+_BLOB_LENGTH = struct.Struct("<I")
+
+
+class _MappedSegment(MutableSequence, Generic[T]):
+    """ Memory-mapped file with header (magic, used bytes) followed by data.
+        Supports only appends, reads are zero-copy.
+    """
+
+    __slots__ = ("path", "_file", "_mmap", "_view", "_used")
+
+    path: str
+    _file: Any
+    _mmap: mmap.mmap
+    _view: memoryview
+    _used: int
+
+    def __init__(self, path: str | os.PathLike, initial_capacity: int = mmap.PAGESIZE) -> None:
+        self.path = os.fspath(path)
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) >= _HEADER.size
+        self._file = open(self.path, "r+b" if exists else "w+b")
+        if exists:
+            self._map(os.path.getsize(self.path))
+            magic, self._used = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                self.close()
+                raise ValueError(f"{self.path!r} is not a yamt segment file")
+        else:
+            self._file.truncate(max(initial_capacity, _HEADER.size))
+            self._map(max(initial_capacity, _HEADER.size))
+            self._used = 0
+            self._write_header()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path!r} ({len(self)} items)>"
+
+    def __delitem__(self, index: SupportsIndex | slice):
+        raise TypeError(f"{self.__class__.__name__} is append-only")
+
+    def insert(self, index: SupportsIndex, value: T):
+        if index.__index__() != len(self):
+            raise TypeError(f"{self.__class__.__name__} is append-only")
+        self.append(value)
+
+    def extend(self, values: Iterable[T]):
+        for i in values:
+            self.append(i)
+
+    def flush(self):
+        self._mmap.flush()
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            ...  # items are still referenced, mapping is closed with them
+        self._file.close()
+
+    @property
+    def nbytes(self) -> int:
+        return self._used
+
+    def _write_header(self):
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self._used)
+
+    def _map(self, size: int):
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._view = memoryview(self._mmap)
+
+    def _reserve(self, size: int) -> int:
+        """ Grows file if needed, returns offset for `size` bytes """
+
+        offset = _HEADER.size + self._used
+        capacity = len(self._mmap)
+        if offset + size > capacity:
+            while offset + size > capacity:
+                capacity *= 2
+            old = self._mmap
+            self._view.release()
+            self._file.truncate(capacity)
+            self._map(capacity)
+            try:
+                old.close()
+            except BufferError:
+                ...
+        return offset
+
+    def _commit(self, size: int):
+        self._used += size
+        self._write_header()
+
+
+class MappedRecordSequence(_MappedSegment[T], Generic[T]):
+    """ Fixed-width records. Items are `memoryview`s of `record_size` bytes,
+        or unpacked values if struct `format` given (single value for single-field format).
+    """
+
+    __slots__ = ("record_size", "_struct", "_single")
+
+    record_size: int
+    _struct: struct.Struct | None
+    _single: bool
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        record_size: int | None = None,
+        *,
+        format: str | None = None,
+        initial_capacity: int = mmap.PAGESIZE
+    ) -> None:
+        assert (record_size is None) != (format is None), "pass record_size or format"
+        if format is not None:
+            self._struct = struct.Struct(format)
+            self.record_size = self._struct.size
+            self._single = len(self._struct.unpack(bytes(self.record_size))) == 1
+        else:
+            self._struct = None
+            self.record_size = record_size
+            self._single = False
+        super().__init__(path, initial_capacity)
+
+    def __len__(self) -> int:
+        return self._used // self.record_size
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._item_at, range(len(self)))
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return list(map(self._item_at, range(*index.indices(len(self)))))
+        return self._item_at(_normalize_index(index, len(self)))
+
+    def __setitem__(self, index: SupportsIndex, value: T):
+        if isinstance(index, slice):
+            raise TypeError("slice assignment is not supported")
+        offset = _HEADER.size + _normalize_index(index, len(self)) * self.record_size
+        self._pack_into(offset, value)
+
+    def append(self, value: T):
+        offset = self._reserve(self.record_size)
+        self._pack_into(offset, value)
+        self._commit(self.record_size)
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        if _normalize_index(index, len(self)) != len(self) - 1:
+            raise TypeError(f"{self.__class__.__name__} is append-only")
+        value = self[-1]
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        self._used -= self.record_size
+        self._write_header()
+        return value
+
+    def clear(self):
+        self._used = 0
+        self._write_header()
+
+    def _item_at(self, index: int) -> T:
+        offset = _HEADER.size + index * self.record_size
+        if self._struct is None:
+            return self._view[offset:offset + self.record_size]
+        values = self._struct.unpack_from(self._mmap, offset)
+        return values[0] if self._single else values
+
+    def _pack_into(self, offset: int, value: Any):
+        if self._struct is None:
+            if len(value) != self.record_size:
+                raise ValueError(f"record must be exactly {self.record_size} bytes")
+            self._view[offset:offset + self.record_size] = value
+        elif self._single:
+            self._struct.pack_into(self._mmap, offset, value)
+        else:
+            self._struct.pack_into(self._mmap, offset, *value)
+
+
+class MappedBlobSequence(_MappedSegment[memoryview]):
+    """ Variable-length records prefixed with their length.
+        Offsets index is built on open, items are `memoryview`s.
+    """
+
+    __slots__ = ("_offsets", )
+
+    _offsets: array
+
+    def __init__(self, path: str | os.PathLike, initial_capacity: int = mmap.PAGESIZE) -> None:
+        super().__init__(path, initial_capacity)
+        self._offsets = array("Q")
+        offset = _HEADER.size
+        end = _HEADER.size + self._used
+        while offset < end:
+            self._offsets.append(offset)
+            offset += _BLOB_LENGTH.size + _BLOB_LENGTH.unpack_from(self._mmap, offset)[0]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return map(self._item_at, self._offsets)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> memoryview:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[memoryview]:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> memoryview | list[memoryview]:
+        if isinstance(index, slice):
+            return list(map(self._item_at, self._offsets[index]))
+        return self._item_at(self._offsets[_normalize_index(index, len(self))])
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any):
+        raise TypeError(f"{self.__class__.__name__} is append-only")
+
+    def append(self, value: bytes | bytearray | memoryview):
+        value = memoryview(value).cast("B")
+        size = _BLOB_LENGTH.size + len(value)
+        offset = self._reserve(size)
+        _BLOB_LENGTH.pack_into(self._mmap, offset, len(value))
+        self._view[offset + _BLOB_LENGTH.size:offset + size] = value
+        self._offsets.append(offset)
+        self._commit(size)
+
+    def pop(self, index: SupportsIndex = -1) -> bytes:
+        if _normalize_index(index, len(self)) != len(self) - 1:
+            raise TypeError(f"{self.__class__.__name__} is append-only")
+        value = self[-1].tobytes()
+        self._used = self._offsets.pop() - _HEADER.size
+        self._write_header()
+        return value
+
+    def clear(self):
+        self._offsets = array("Q")
+        self._used = 0
+        self._write_header()
+
+    def _item_at(self, offset: int) -> memoryview:
+        start = offset + _BLOB_LENGTH.size
+        return self._view[start:start + _BLOB_LENGTH.unpack_from(self._mmap, offset)[0]]
+
+
+class SpillingChainedList(ChainedSequence[MutableSequence[T], T], Generic[T]):
+    """ Chain where only newest `keep_in_memory` segments are lists,
+        older ones are spilled to files in `directory` via `segment_factory`
+        (`MappedBlobSequence` by default, so items should be bytes-like).
+        New segment is started every `segment_size` appended items.
+        Spilled segments are always new files. With `load` segments left in `directory`
+        by previous list are reopened in order, so `directory` should not be shared.
+        `close` spills everything to keep it persistent, or removes files if `delete`.
+    """
+
+    __slots__ = (
+        "directory",
+        "segment_size",
+        "keep_in_memory",
+        "segment_factory",
+        "delete",
+        "_counter",
+    )
+
+    directory: str
+    segment_size: int
+    keep_in_memory: int
+    segment_factory: Callable[[str], MutableSequence[T]]
+    delete: bool
+    _counter: int
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        segment_size: int = 100_000,
+        keep_in_memory: int = 1,
+        segment_factory: Callable[[str], MutableSequence[T]] = MappedBlobSequence,
+        *,
+        load: bool = False,
+        delete: bool = False
+    ) -> None:
+        assert segment_size > 0 and keep_in_memory > 0
+        self.directory = os.fspath(directory)
+        self.segment_size = segment_size
+        self.keep_in_memory = keep_in_memory
+        self.segment_factory = segment_factory
+        self.delete = delete
+        self._counter = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+        loaded = list()
+        if load:
+            for counter, name in sorted(_segment_files(self.directory)):
+                loaded.append(segment_factory(os.path.join(self.directory, name)))
+                self._counter = counter
+        super().__init__(*loaded, list())
+
+    def __getitem__(self, index: SupportsIndex | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step > 0:
+                return list(itertools.islice(self, start, stop, step))
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.seqs)} segments, {len(self)} items)"
+
+    def append(self, value: T):
+        if len(self.seqs[-1]) >= self.segment_size:
+            self.rotate_segment()
+        self.seqs[-1].append(value)
+
+    def extend(self, values: Iterable[T]):
+        for i in values:
+            self.append(i)
+
+    def rotate_segment(self):
+        """ Starts new in-memory segment, spilling old ones if needed """
+
+        self.seqs = (*self.seqs, list())
+        self.spill()
+
+    def spill(self, keep: int | None = None):
+        """ Moves all in-memory segments except newest `keep` to disk """
+
+        if keep is None:
+            keep = self.keep_in_memory
+        in_memory = [i for i, seq in enumerate(self.seqs) if isinstance(seq, list)]
+        to_spill = set(in_memory[:max(0, len(in_memory) - keep)])
+        if not to_spill:
+            return
+
+        seqs = list(self.seqs)
+        for i in to_spill:
+            segment = self.segment_factory(self._next_path())
+            segment.extend(seqs[i])
+            seqs[i] = segment
+        self.seqs = tuple(seqs)
+
+    def close(self):
+        if not self.delete:
+            self.seqs = tuple(i for i in self.seqs if i or not isinstance(i, list)) or self.seqs
+            self.spill(0)
+        for i in self.seqs:
+            close = getattr(i, "close", None)
+            if close is not None:
+                close()
+            if self.delete:
+                path = getattr(i, "path", None)
+                if path is not None:
+                    os.unlink(path)
+        self.seqs = (list(), )
+
+    def _next_path(self) -> str:
+        """ New empty file, so segments of other lists in same directory are never reused """
+
+        self._counter += 1
+        fd, path = tempfile.mkstemp(
+            suffix=".bin",
+            prefix=f"segment-{self._counter:08d}-",
+            dir=self.directory
+        )
+        os.close(fd)
+        return path
+
+
+def _segment_files(directory: str) -> Iterator[tuple[int, str]]:
+    """ Yields counters and names of segment files created by `SpillingChainedList` """
+
+    for name in os.listdir(directory):
+        if not (name.startswith("segment-") and name.endswith(".bin")):
+            continue
+        counter = name[len("segment-"):].partition("-")[0]
+        if counter.isdigit():
+            yield int(counter), name
+
+
+def _normalize_index(index: SupportsIndex, length: int) -> int:
+    index = index.__index__()
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("segment index out of range")
+    return index
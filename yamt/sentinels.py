@@ -0,0 +1,8 @@
+class Sentinel:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"<SENTINEL ({id(self)})>"
+
+
+sentinel = Sentinel()
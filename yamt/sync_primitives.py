@@ -0,0 +1,429 @@
+""" Thread-safe and process-shared counterparts of `asyncio_sync_primitives` """
+from typing import TYPE_CHECKING, Literal, Any
+from multiprocessing import shared_memory
+import multiprocessing
+import threading
+import weakref
+import asyncio
+import struct
+import types
+import queue
+import time
+import os
+
+from .exceptions import ContextSkip, LockOverflowError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+    from multiprocessing.synchronize import Lock as ProcessLock
+
+
+class ThreadGrab:
+    """ Usage example:
+        ```
+        with ThreadGrab() as grab, grab.skip:
+            ...
+        ```
+    """
+
+    class Skip:
+        __slots__ = ("grab", )
+
+        grab: "ThreadGrab"
+
+        def __init__(self, grab: "ThreadGrab") -> None:
+            self.grab = grab
+
+        def __enter__(self):
+            if not self.grab._first():
+                raise ContextSkip()
+
+        def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            tb: types.TracebackType | None
+        ):
+            ...
+
+    grab_count: int = 0
+    skip: Skip
+    _lock: threading.Lock
+    _local: threading.local
+    """ `entered` stack per thread: whether each enter of this thread was the first one """
+
+    def __init__(self) -> None:
+        self.skip = self.Skip(self)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self) -> "Self":
+        with self._lock:
+            self.grab_count += 1
+            first = self.grab_count == 1
+        entered = getattr(self._local, "entered", None)
+        if entered is None:
+            entered = self._local.entered = list()
+        entered.append(first)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> Literal[True] | None:
+        self._local.entered.pop()
+        with self._lock:
+            self.grab_count -= 1
+        if isinstance(exc, ContextSkip):
+            return True
+        return None
+
+    def _first(self) -> bool:
+        entered = getattr(self._local, "entered", None)
+        return bool(entered) and entered[-1]
+
+
+class ThreadOverflowLock:
+    limit: int
+    counter: int = 0
+    _lock: threading.Lock
+    _counter_lock: threading.Lock
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        self.release()
+        return None
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self.limit <= self.counter:
+            raise LockOverflowError()
+
+        if not self._lock.acquire(blocking, timeout):
+            return False
+        with self._counter_lock:
+            self.counter += 1
+        return True
+
+    def release(self):
+        self._lock.release()
+        with self._counter_lock:
+            self.counter -= 1
+
+
+class ThreadSkippedOverflowLock(ThreadOverflowLock):
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        if isinstance(exc, LockOverflowError):
+            return True
+        return super().__exit__(exc_type, exc, tb)
+
+
+class ThreadPerSecondSemaphore(threading.Semaphore):
+    """ Releases are deferred and spread by `1 / value` seconds in background thread.
+        Thread exits after `idle_timeout` seconds without releases
+        (so idle semaphore can be collected) and is restarted in forked child.
+    """
+
+    idle_timeout: float = 1.0
+    deffer_time: float
+    _releases: queue.SimpleQueue
+    _releaser: threading.Thread | None = None
+    _releaser_lock: threading.Lock
+
+    def __init__(self, value: int = 1) -> None:
+        super().__init__(value)
+        self.deffer_time = 1 / value
+        self._releases = queue.SimpleQueue()
+        self._releaser_lock = threading.Lock()
+        _thread_semaphores.add(self)
+
+    def release(self, n: int = 1):
+        for _ in range(n):
+            self._releases.put(None)
+        with self._releaser_lock:
+            if self._releaser is None:
+                self._releaser = threading.Thread(
+                    target=self._deffered_exit,
+                    name=f"{self.__class__.__name__}-releaser",
+                    daemon=True
+                )
+                self._releaser.start()
+
+    def _deffered_exit(self):
+        while True:
+            try:
+                self._releases.get(timeout=max(self.idle_timeout, self.deffer_time))
+            except queue.Empty:
+                with self._releaser_lock:
+                    if self._releases.empty():
+                        self._releaser = None
+                        return
+                continue
+            time.sleep(self.deffer_time)
+            super().release()
+
+
+_thread_semaphores: "weakref.WeakSet[ThreadPerSecondSemaphore]" = weakref.WeakSet()
+
+
+def _reset_thread_semaphores_after_fork():
+    """ Releaser threads do not survive fork, queued releases are picked up by new ones """
+
+    for i in tuple(_thread_semaphores):
+        i._releaser_lock = threading.Lock()
+        i._releaser = None
+        if not i._releases.empty():
+            i.release(0)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_semaphores_after_fork)
+
+
+class _SharedState:
+    """ Fixed struct in shared memory segment, guarded by process lock.
+        Pickled (e.g. for spawned processes) as segment name and lock.
+    """
+
+    _format: str = ""
+
+    shm: shared_memory.SharedMemory
+    lock: "ProcessLock"
+    _owner: bool
+
+    def __init__(
+        self,
+        *initial: Any,
+        name: str | None = None,
+        create: bool = True,
+        lock: "ProcessLock | None" = None
+    ) -> None:
+        size = struct.calcsize(self._format)
+        if create:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+            struct.pack_into(self._format, self.shm.buf, 0, *initial)
+        else:
+            self.shm = shared_memory.SharedMemory(name)
+        self.lock = multiprocessing.Lock() if lock is None else lock
+        self._owner = create
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["shm"] = self.shm.name
+        state["_owner"] = False
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        state["shm"] = shared_memory.SharedMemory(state["shm"])
+        self.__dict__.update(state)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self):
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+    def _read(self) -> tuple:
+        return struct.unpack_from(self._format, self.shm.buf, 0)
+
+    def _write(self, *values: Any):
+        struct.pack_into(self._format, self.shm.buf, 0, *values)
+
+
+class SharedOverflowLock(_SharedState):
+    """ `OverflowLock` shared between processes (forked or given with pickling) """
+
+    _format = "q"
+
+    limit: int
+    _mutex: "ProcessLock"
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        name: str | None = None,
+        create: bool = True,
+        lock: "ProcessLock | None" = None,
+        mutex: "ProcessLock | None" = None
+    ) -> None:
+        super().__init__(0, name=name, create=create, lock=lock)
+        self.limit = limit
+        self._mutex = multiprocessing.Lock() if mutex is None else mutex
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        self.release()
+        return None
+
+    async def __aenter__(self) -> None:
+        await self.aacquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        self.release()
+        return None
+
+    @property
+    def counter(self) -> int:
+        return self._read()[0]
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        self._check_overflow()
+        if not self._mutex.acquire(blocking, None if timeout < 0 else timeout):
+            return False
+        self._add(1)
+        return True
+
+    async def aacquire(self, poll_interval: float = 0.001):
+        """ Non-blocking for event loop: polls the lock with `poll_interval` """
+
+        self._check_overflow()
+        while not self._mutex.acquire(False):
+            await asyncio.sleep(poll_interval)
+        self._add(1)
+
+    def release(self):
+        self._mutex.release()
+        self._add(-1)
+
+    def _check_overflow(self):
+        if self.limit <= self.counter:
+            raise LockOverflowError()
+
+    def _add(self, value: int):
+        with self.lock:
+            self._write(self._read()[0] + value)
+
+
+class SharedSkippedOverflowLock(SharedOverflowLock):
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        if isinstance(exc, LockOverflowError):
+            return True
+        return super().__exit__(exc_type, exc, tb)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        if isinstance(exc, LockOverflowError):
+            return True
+        return await super().__aexit__(exc_type, exc, tb)
+
+
+class SharedPerSecondSemaphore(_SharedState):
+    """ Token bucket (`value` tokens, refilled with `value` per second) in shared memory,
+        so all processes together do not exceed `value` acquires per second.
+        Release is no-op, it exists for compatibility with semaphore API.
+    """
+
+    _format = "dd"
+
+    value: int
+
+    def __init__(
+        self,
+        value: int = 1,
+        *,
+        name: str | None = None,
+        create: bool = True,
+        lock: "ProcessLock | None" = None
+    ) -> None:
+        super().__init__(float(value), time.monotonic(), name=name, create=create, lock=lock)
+        self.value = value
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        self.release()
+        return None
+
+    async def __aenter__(self) -> None:
+        await self.aacquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None
+    ) -> bool | None:
+        self.release()
+        return None
+
+    def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if not blocking or (deadline is not None and time.monotonic() + wait > deadline):
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self):
+        while wait := self._take():
+            await asyncio.sleep(wait)
+
+    def release(self):
+        ...
+
+    def _take(self) -> float:
+        """ Takes token, returns 0 or time to wait for next token """
+
+        with self.lock:
+            tokens, updated_at = self._read()
+            now = time.monotonic()
+            tokens = min(float(self.value), tokens + (now - updated_at) * self.value)
+            if tokens >= 1:
+                self._write(tokens - 1, now)
+                return 0.0
+            self._write(tokens, now)
+        return (1 - tokens) / self.value